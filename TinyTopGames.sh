@@ -33,14 +33,14 @@ fi
 
 # Check if all requirements are installed
 echo "🔍 Checking dependencies..."
-$PYTHON_CMD -c "import pygame, requests, dotenv" 2>/dev/null
+$PYTHON_CMD -c "import pygame, numpy, requests, dotenv" 2>/dev/null
 if [ $? -ne 0 ]; then
     echo "📦 Installing missing dependencies..."
     $PYTHON_CMD -m pip install -r requirements.txt
     if [ $? -ne 0 ]; then
         echo "⚠️  Some packages failed to install. Trying alternative approach..."
         # Try installing without problematic packages first
-        $PYTHON_CMD -m pip install pygame requests python-dotenv
+        $PYTHON_CMD -m pip install pygame numpy requests python-dotenv
         if [ $? -ne 0 ]; then
             echo "❌ Error: Failed to install core requirements!"
             echo "Please check your internet connection and try again."
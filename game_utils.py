@@ -15,7 +15,6 @@ Features:
 import pygame
 import sys
 import os
-import time
 
 # Try to import ResourceManager for sounds
 try:
@@ -56,10 +55,10 @@ def play_exit_sound_and_wait():
     """Play the exit sound and wait for it to finish"""
     resources = get_resource_manager()
     if resources:
-        resources.play_sound("minimize_006")
-        # Wait a bit for the sound to finish playing
-        # minimize_006 is typically around 0.5-1 second, so wait 1.2 seconds to be safe
-        time.sleep(1.2)
+        sound = resources.play_sound("minimize_006")
+        # Wait only as long as the sound actually plays before the game quits the mixer
+        if sound:
+            pygame.time.wait(int(sound.get_length() * 1000))
 
 def handle_common_events(event):
     """
@@ -81,6 +80,21 @@ def handle_common_events(event):
     
     return True
 
+# Events handle_common_events reacts to, plus window exposes so games can repaint
+COMMON_EVENTS = (pygame.QUIT, pygame.KEYDOWN, pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED)
+
+def allow_only_events(*event_types):
+    """
+    Stop SDL from queueing events a game never looks at (mouse motion, window
+    focus, ...), so they are never turned into Python Event objects.
+    Call this after the display is set up.
+    
+    Args:
+        *event_types: Event types the game needs on top of COMMON_EVENTS
+    """
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(COMMON_EVENTS + event_types)
+
 def setup_game_window(width, height, title):
     """
     Set up a standard game window with consistent settings.
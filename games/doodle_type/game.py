@@ -15,11 +15,14 @@ import random
 import sys
 import os
 import threading
+import functools
 import queue
+from concurrent.futures import Future
 import dataclasses
 from typing import Optional
 import pickle
 from pathlib import Path
+import numpy as np
 
 try:
     from quickdraw import QuickDrawData
@@ -51,13 +54,16 @@ SMALL_W = 4
 BIG_W = 6
 SOUND_FILE = "pen_paper"
 SOUND_LENGTH_MS = 33000  # 33 seconds
+DOWNLOAD_WORKERS = 4  # Concurrent doodle downloads
+FPS = 60
+IDLE_FPS = 15  # The idle screen is static, so it only needs to poll input
 
 if QUICKDRAW_AVAILABLE:
     qd = QuickDrawData()
-    CATEGORIES = qd.drawing_names
+    CATEGORIES = tuple(qd.drawing_names)  # Snapshot once; sampled from all session
 else:
     qd = None
-    CATEGORIES = ["cat", "dog", "car", "house", "tree"]  # Fallback categories
+    CATEGORIES = ("cat", "dog", "car", "house", "tree")  # Fallback categories
 
 # Unified job queue system
 @dataclasses.dataclass
@@ -69,6 +75,8 @@ class DownloadJob:
     visible: bool = True  # False for pre-downloaded backup items
     image_failed: bool = False
     audio_failed: bool = False
+    geometry: Optional[dict] = None  # prepare_strokes() output for image_data
+    preview: Optional[object] = None  # Small doodle surface, rendered on the download thread
     
     @property
     def is_complete(self) -> bool:
@@ -78,21 +86,40 @@ class DownloadJob:
     def has_failed(self) -> bool:
         return self.image_failed or self.audio_failed
 
+@dataclasses.dataclass
+class CachedDrawing:
+    """The parts of a QuickDrawing the game uses, as stored in the per-word disk cache"""
+    name: str
+    strokes: list
+    recognized: bool
+
 # Job management
+# job_lock only guards compound check-then-mutate operations on job_queue. Single-key
+# lookups, snapshots and per-job field assignments are atomic under the GIL and skip it.
 job_queue = {}  # word -> DownloadJob
 job_lock = threading.Lock()
-download_queue = queue.Queue()
-download_thread = None
+download_requests = queue.SimpleQueue()  # (word, Future) pairs for the download workers
+pending_downloads = {}  # word -> Future, so a word already downloading isn't fetched twice
+job_events = queue.SimpleQueue()  # Words whose job just completed or failed
+shutting_down = threading.Event()  # Set when the game closes; late download callbacks then do nothing
 failed_words = set()  # Track words that have failed to avoid retrying them
+word_pool = []  # Shuffled categories still to hand out, refilled when it runs dry
 
 # Drawing cache system
+# Only ever touched with single-key get/set (atomic under the GIL) once downloads start,
+# so the cache needs no lock of its own
 drawing_cache = {}  # word -> drawing_data
-drawing_cache_lock = threading.Lock()
 cache_dir = os.path.join(os.path.dirname(__file__), "drawing_cache")
+word_cache_dir = os.path.join(cache_dir, "words")  # One pickle per newly downloaded word
+WORD_CACHE_VERSION = 1  # Bump when the per-word entry format changes; older entries are ignored
+
+def word_cache_file(word):
+    """Path of the on-disk cache entry for a single word"""
+    return os.path.join(word_cache_dir, f"{word}.pkl")
 
 def init_drawing_cache():
     """Initialize the drawing cache system and load from disk"""
-    Path(cache_dir).mkdir(exist_ok=True)
+    Path(word_cache_dir).mkdir(parents=True, exist_ok=True)
     
     # Load existing cache from disk
     cache_file = os.path.join(cache_dir, "drawings.pkl")
@@ -100,86 +127,125 @@ def init_drawing_cache():
         try:
             with open(cache_file, 'rb') as f:
                 loaded_cache = pickle.load(f)
-                with drawing_cache_lock:
-                    drawing_cache.update(loaded_cache)
+                drawing_cache.update(loaded_cache)
                 print(f"💾 Loaded {len(loaded_cache)} cached drawings from disk")
         except Exception as e:
             print(f"⚠️ Could not load drawing cache: {e}")
-
-def save_drawing_cache():
-    """Save the current drawing cache to disk"""
-    cache_file = os.path.join(cache_dir, "drawings.pkl")
-    try:
-        with drawing_cache_lock:
-            with open(cache_file, 'wb') as f:
-                pickle.dump(drawing_cache, f)
-            print(f"💾 Saved {len(drawing_cache)} drawings to cache")
-    except Exception as e:
-        print(f"⚠️ Could not save drawing cache: {e}")
+    
+    # Half-written entries from a run that was killed mid-save
+    for leftover in Path(word_cache_dir).glob("*.pkl.tmp"):
+        leftover.unlink(missing_ok=True)
+    
+    # Then every drawing downloaded on a previous run
+    loaded = 0
+    for entry in Path(word_cache_dir).glob("*.pkl"):
+        try:
+            with open(entry, 'rb') as f:
+                record = pickle.load(f)
+            if not isinstance(record, dict) or record.get("version") != WORD_CACHE_VERSION:
+                continue
+            drawing_cache[entry.stem] = CachedDrawing(entry.stem, record["strokes"], record["recognized"])
+            loaded += 1
+        except Exception as e:
+            # Unreadable entry; delete it so the word is downloaded again instead of warning every launch
+            print(f"⚠️ Removing unreadable cached drawing {entry.name}: {e}")
+            entry.unlink(missing_ok=True)
+    if loaded:
+        print(f"💾 Loaded {loaded} downloaded drawings from disk")
 
 def get_cached_drawing(word):
     """Get a drawing from cache if available"""
-    with drawing_cache_lock:
-        return drawing_cache.get(word)
+    return drawing_cache.get(word)
 
 def cache_drawing(word, drawing_data):
-    """Cache a drawing for future use"""
-    with drawing_cache_lock:
-        drawing_cache[word] = drawing_data
-        print(f"💾 Cached drawing for: {word} (cache size: {len(drawing_cache)})")
-    
-    # Save to disk every 10 new drawings to avoid too much I/O
-    if len(drawing_cache) % 10 == 0:
-        threading.Thread(target=save_drawing_cache, daemon=True).start()
+    """Cache a drawing for future use, writing it straight through to disk"""
+    drawing_cache[word] = drawing_data
+    print(f"💾 Cached drawing for: {word} (cache size: {len(drawing_cache)})")
+    
+    # Persist just this word so later runs never refetch it, without rewriting the whole cache.
+    # Only plain stroke data is stored, not the QuickDrawing object and its cached image state.
+    record = dict(version=WORD_CACHE_VERSION, strokes=list(drawing_data.strokes), recognized=drawing_data.recognized)
+    # Write to a temp file and swap it in, so a process killed mid-write never leaves a truncated entry
+    path = word_cache_file(word)
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(record, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"⚠️ Could not save cached drawing for {word}: {e}")
 
 def create_job(word: str, resource_manager=None, visible: bool = True):
     """Create a new download job for a word"""
     with job_lock:
-        if word not in job_queue and word not in failed_words:
-            job_queue[word] = DownloadJob(word=word, visible=visible)
-            print(f"📋 Created job for: {word} (visible: {visible})")
-            # Queue the image download
-            download_queue.put(word)
-            # Queue the audio download
-            if resource_manager:
-                resource_manager.preload_voice(word)
-                print(f"🎤 Queued audio for: {word}")
-            return True
-        return False
+        if word in job_queue or word in failed_words:
+            return False
+        job_queue[word] = DownloadJob(word=word, visible=visible)
+    
+    print(f"📋 Created job for: {word} (visible: {visible})")
+    # Queue the image download, sharing any fetch of the same word still in flight
+    future = pending_downloads.get(word)
+    if future is None:
+        future = pending_downloads[word] = Future()
+        download_requests.put((word, future))
+    future.add_done_callback(functools.partial(download_done, word))
+    # Queue the audio download
+    if resource_manager:
+        resource_manager.preload_voice(word)
+        print(f"🎤 Queued audio for: {word}")
+    return True
 
 def mark_image_ready(word: str, image_data):
     """Mark the image as ready for a job"""
-    with job_lock:
-        if word in job_queue:
-            if image_data is None:
-                # Image download failed
-                job_queue[word].image_failed = True
-                print(f"❌ Image failed for: {word}")
-                return False
-            else:
-                job_queue[word].image_ready = True
-                job_queue[word].image_data = image_data
-                print(f"🖼️ Image ready for: {word}")
-                return job_queue[word].is_complete
+    job = job_queue.get(word)
+    if job is None:
+        return False
+    if image_data is None:
+        # Image download failed
+        job.image_failed = True
+        print(f"❌ Image failed for: {word}")
+        job_events.put(word)
+        return False
+    # Data first, so the job never looks ready without its image
+    job.image_data = image_data
+    job.image_ready = True
+    print(f"🖼️ Image ready for: {word}")
+    if job.is_complete:
+        job_events.put(word)
+        return True
     return False
 
 def mark_audio_ready(word: str):
     """Mark the audio as ready for a job"""
-    with job_lock:
-        if word in job_queue:
-            job_queue[word].audio_ready = True
-            print(f"🔊 Audio ready for: {word}")
-            return job_queue[word].is_complete
+    job = job_queue.get(word)
+    if job is None:
+        return False
+    job.audio_ready = True
+    print(f"🔊 Audio ready for: {word}")
+    if job.is_complete:
+        job_events.put(word)
+        return True
     return False
 
 def mark_audio_failed(word: str):
     """Mark the audio as failed for a job"""
-    with job_lock:
-        if word in job_queue:
-            job_queue[word].audio_failed = True
-            print(f"❌ Audio failed for: {word}")
+    job = job_queue.get(word)
+    if job is not None:
+        job.audio_failed = True
+        print(f"❌ Audio failed for: {word}")
+        job_events.put(word)
     return False
 
+def drain_job_events():
+    """Empty the job event queue; True if any job completed or failed since the last call"""
+    changed = False
+    while True:
+        try:
+            job_events.get_nowait()
+        except queue.Empty:
+            return changed
+        changed = True
+
 def get_completed_jobs(visible_only: bool = True):
     """Get all completed jobs and remove them from queue"""
     completed = []
@@ -197,11 +263,25 @@ def get_completed_jobs(visible_only: bool = True):
 def get_backup_job():
     """Get one backup job (invisible) and make it visible"""
     with job_lock:
-        for word, job in job_queue.items():
-            if job.is_complete and not job.visible:
-                job.visible = True
-                print(f"🔄 Promoting backup job to visible: {word}")
-                return job_queue.pop(word)
+        backup = next((job for job in job_queue.values() if job.is_complete and not job.visible), None)
+        if backup is not None:
+            backup.visible = True
+            job_queue.pop(backup.word)
+    
+    # Log outside the lock so stdout never holds up the download threads
+    if backup is not None:
+        print(f"🔄 Promoting backup job to visible: {backup.word}")
+    return backup
+
+def pick_new_word():
+    """Pop the next shuffled category that has no job and hasn't failed, or None if none are left"""
+    for _ in range(2):  # At most one reshuffle per call
+        while word_pool:
+            word = word_pool.pop()
+            if word not in job_queue and word not in failed_words:
+                return word
+        word_pool.extend(CATEGORIES)
+        random.shuffle(word_pool)
     return None
 
 def clean_failed_jobs(resource_manager=None):
@@ -215,56 +295,64 @@ def clean_failed_jobs(resource_manager=None):
     
     # Create replacement jobs for failed ones
     for failed_job in failed_jobs:
-        attempts = 0
-        while attempts < 10:  # Limit attempts to avoid infinite loops
-            new_word = random.choice(CATEGORIES)
-            if create_job(new_word, resource_manager, visible=failed_job.visible):
-                print(f"🔄 Replaced failed job '{failed_job.word}' with '{new_word}'")
-                break
-            attempts += 1
-
-def get_job_count():
-    """Get current number of jobs in queue"""
-    with job_lock:
-        return len(job_queue)
+        new_word = pick_new_word()
+        if new_word and create_job(new_word, resource_manager, visible=failed_job.visible):
+            print(f"🔄 Replaced failed job '{failed_job.word}' with '{new_word}'")
 
 def get_visible_job_count():
     """Get current number of visible jobs in queue"""
-    with job_lock:
-        return len([job for job in job_queue.values() if job.visible])
+    # tuple() snapshots the values in one step, so a concurrent insert can't break iteration
+    return len([job for job in tuple(job_queue.values()) if job.visible])
 
 def get_backup_job_count():
     """Get current number of backup (invisible) jobs in queue"""
-    with job_lock:
-        return len([job for job in job_queue.values() if not job.visible])
+    return len([job for job in tuple(job_queue.values()) if not job.visible])
+
+def download_done(word, future):
+    """Record a finished download on its job (runs on the download worker thread)"""
+    pending_downloads.pop(word, None)
+    if future.cancelled() or shutting_down.is_set():  # Dropped at shutdown, or pygame is going away
+        return
+    try:
+        drawing = future.result()
+        # Prepare and render the small doodle here so promoting the job costs the main loop nothing
+        job = job_queue.get(word)
+        if job is not None and drawing and drawing.strokes:
+            job.geometry = prepare_strokes(drawing.strokes)
+            job.preview = render(job.geometry, DOODLE_SIZE, TEXT, SMALL_W)
+    except Exception as e:
+        print(f"❌ Error downloading {word}: {e}")
+        # Mark as failed so it gets replaced
+        drawing = None
+    
+    # The game may have closed while this was rendering
+    if shutting_down.is_set():
+        return
+    
+    # Mark image as ready and check if job is complete
+    if mark_image_ready(word, drawing):
+        print(f"✅ Job complete for: {word}")
 
 def download_worker():
-    """Background thread worker for downloading doodles"""
+    """Resolve queued download futures; a daemon thread, so quitting never waits on the network"""
     while True:
-        try:
-            word = download_queue.get(timeout=1)
-            if word is None:  # Shutdown signal
-                break
-            
-            print(f"⬇️ Downloading image for: {word}")
-            # Use more efficient download - only try 3 times instead of 100
-            drawing = choose_efficient(word)
-            
-            # Mark image as ready and check if job is complete
-            job_complete = mark_image_ready(word, drawing)
-            
-            if job_complete:
-                print(f"✅ Job complete for: {word}")
-            
-            download_queue.task_done()
-            
-        except queue.Empty:
+        word, future = download_requests.get()
+        if not future.set_running_or_notify_cancel():  # Cancelled while still queued
             continue
+        try:
+            future.set_result(choose_efficient(word))
         except Exception as e:
-            print(f"❌ Error downloading {word}: {e}")
-            # Mark as failed so it gets replaced
-            mark_image_ready(word, None)
-            download_queue.task_done()
+            future.set_exception(e)
+
+def start_download_workers():
+    """Start the daemon threads that download doodles in parallel"""
+    for i in range(DOWNLOAD_WORKERS):
+        threading.Thread(target=download_worker, name=f"doodle-download-{i}", daemon=True).start()
+
+def cancel_pending_downloads():
+    """Drop downloads that haven't started yet; running ones are left to die with the process"""
+    for future in tuple(pending_downloads.values()):
+        future.cancel()
 
 def choose_efficient(word, tries=3):
     """More efficient version that tries fewer times and uses cache"""
@@ -276,17 +364,24 @@ def choose_efficient(word, tries=3):
     
     # Not in cache, download it
     print(f"⬇️ Downloading new drawing for: {word}")
+    fallback = None
     for _ in range(tries):
         try:
             d = qd.get_drawing(word)
-            if d and d.recognized and sum(len(s) for s in d.strokes) > 20:
-                cache_drawing(word, d)  # Cache successful download
-                return d
         except Exception as e:
             print(f"Network error for {word}: {e}")
             continue
+        if d and d.recognized and sum(len(s) for s in d.strokes) > 20:
+            cache_drawing(word, d)  # Cache successful download
+            return d
+        fallback = fallback or d
     
-    # Final attempt - return whatever we get and cache it
+    # Settle for a weaker drawing we already fetched rather than fetching yet another
+    if fallback:
+        cache_drawing(word, fallback)  # Cache even if not perfect
+        return fallback
+    
+    # Final attempt - every try failed, return whatever we get and cache it
     try:
         d = qd.get_drawing(word)
         if d:
@@ -296,51 +391,31 @@ def choose_efficient(word, tries=3):
         print(f"Failed to download {word}: {e}")
         return None
 
-def choose(word, tries=100):
-    for _ in range(tries):
-        d = qd.get_drawing(word)
-        if d and d.recognized and sum(len(s) for s in d.strokes) > 20:
-            return d
-    return qd.get_drawing(word)
-
 def get_drawing_async(word):
     """Get a drawing from a completed job"""
-    with job_lock:
-        if word in job_queue and job_queue[word].is_complete:
-            return job_queue[word].image_data
+    job = job_queue.get(word)
+    if job is not None and job.is_complete:
+        return job.image_data
     return None
 
-def is_drawing_ready(word):
-    """Check if a complete job is ready (both image and audio)"""
-    with job_lock:
-        return word in job_queue and job_queue[word].is_complete
-
 def decode_stroke(stroke):
-    """Convert stroke data to list of (x,y) coordinates."""
+    """Convert stroke data to an (N, 2) int16 array of (x, y) coordinates."""
     # The quickdraw Python library returns strokes as [[x0, y0], [x1, y1], ...]
-    # Each element is already an [x, y] coordinate pair
-    if not stroke:
-        return []
-    
-    # Convert list of [x, y] pairs to list of (x, y) tuples
-    return [(pt[0], pt[1]) for pt in stroke if len(pt) >= 2]
-
-def all_points(strokes):
-    pts = []
-    for s in strokes:
-        pts.extend(decode_stroke(s))
-    return pts
-
-def get_bounds(strokes):
-    """Get the bounding box for all strokes"""
-    pts = all_points(strokes)
-    if not pts:
+    # QuickDraw coordinates are small integers; int16 keeps them compact until scaling
+    pts = np.asarray(stroke, dtype=np.int16)
+    if pts.ndim != 2 or pts.shape[1] < 2:
+        return np.empty((0, 2), dtype=np.int16)
+    return pts[:, :2]
+
+def get_bounds(arrays):
+    """Get the bounding box for all decoded stroke arrays"""
+    arrays = [a for a in arrays if len(a)]
+    if not arrays:
         return 0, 0, 1, 1
     
-    xs = [p[0] for p in pts]
-    ys = [p[1] for p in pts]
-    minx, maxx = min(xs), max(xs)
-    miny, maxy = min(ys), max(ys)
+    pts = np.concatenate(arrays)
+    minx, miny = pts.min(axis=0).tolist()
+    maxx, maxy = pts.max(axis=0).tolist()
     
     w = maxx - minx
     h = maxy - miny
@@ -353,124 +428,163 @@ def get_bounds(strokes):
     
     return minx, miny, w, h
 
-def render(strokes, size, color, width, progress=1.0):
-    """Render strokes with animation progress"""
-    if not strokes:
-        surf = pygame.Surface((size, size), pygame.SRCALPHA)
-        pygame.draw.rect(surf, color, (0, 0, size, size), width)
-        return surf
-    
-    # Get bounds for ALL strokes (not just visible ones)
-    minx, miny, w, h = get_bounds(strokes)
+def prepare_strokes(strokes):
+    """Decode strokes once into a single packed point array for repeated rendering"""
+    arrays = [decode_stroke(s) for s in strokes]
+    bounds = get_bounds(arrays)
+    # Strokes with fewer than two points are never drawn
+    arrays = [a for a in arrays if len(a) >= 2]
+    return dict(
+        points=np.concatenate(arrays) if arrays else np.empty((0, 2), dtype=np.int16),
+        bounds=bounds,
+        ends=np.cumsum([len(a) for a in arrays], dtype=np.intp),  # point count up to each stroke's end
+    )
+
+def scale_strokes(geometry, size, width):
+    """Scale prepared strokes to fit size, as integer point lists ready for drawing"""
+    # Bounds cover ALL strokes (not just visible ones)
+    minx, miny, w, h = geometry["bounds"]
     
     # Calculate scale to fit in desired size
     scale = size / max(w, h)
-    
-    # Create surface with padding
-    surf_w = int(w * scale) + width * 2
-    surf_h = int(h * scale) + width * 2
-    surf = pygame.Surface((surf_w, surf_h), pygame.SRCALPHA)
-    
+    origin = np.array([minx, miny], dtype=np.float32)
     offset = width
     
-    # Calculate how many points to draw based on progress
-    total_points = sum(len(decode_stroke(s)) for s in strokes)
-    points_to_draw = int(total_points * progress)
-    
-    points_drawn = 0
-    
-    # Draw strokes with animation
-    for stroke in strokes:
-        decoded = decode_stroke(stroke)
-        if len(decoded) < 2:
-            continue
-        
-        # Scale all points
-        scaled = [((x - minx) * scale + offset, (y - miny) * scale + offset) for x, y in decoded]
-        
-        # Determine how many points of this stroke to draw
-        stroke_points = len(decoded)
-        
-        if points_drawn + stroke_points <= points_to_draw:
-            # Draw entire stroke
-            pygame.draw.lines(surf, color, False, scaled, width)
-            points_drawn += stroke_points
-        elif points_drawn < points_to_draw:
-            # Draw partial stroke
-            points_in_stroke = points_to_draw - points_drawn
-            if points_in_stroke >= 2:
-                pygame.draw.lines(surf, color, False, scaled[:points_in_stroke], width)
-            points_drawn = points_to_draw
-            break
-        else:
-            # Don't draw this stroke yet
-            break
+    # One vectorized pass over every point, into compact int16 pixel coordinates
+    points = geometry["points"]
+    scaled = ((points - origin) * scale + offset).astype(np.int16)
+    
+    return dict(
+        size=(int(w * scale) + width * 2, int(h * scale) + width * 2),  # surface with padding
+        strokes=[stroke.tolist() for stroke in np.split(scaled, geometry["ends"][:-1])],
+        ends=geometry["ends"],
+    )
+
+def draw_progress(surf, scaled, color, width, start, stop):
+    """Draw the segments reaching points start..stop-1 of pre-scaled strokes onto surf"""
+    strokes = scaled["strokes"]
+    ends = scaled["ends"]
+    if stop - start < 1 or stop < 2:
+        return
     
+    # Only the strokes the new points fall in; the segment into point `start` needs point start-1
+    first = int(np.searchsorted(ends, max(start - 1, 0), side='right'))
+    last = min(int(np.searchsorted(ends, stop - 1, side='right')), len(strokes) - 1)
+    for k in range(first, last + 1):
+        base = int(ends[k - 1]) if k else 0
+        lo = max(start - 1, base) - base
+        hi = min(stop, int(ends[k])) - base
+        if hi - lo >= 2:
+            pygame.draw.lines(surf, color, False, strokes[k][lo:hi], width)
+
+def render_progress(scaled, color, width, progress=1.0):
+    """Render pre-scaled strokes up to the given animation progress"""
+    surf = pygame.Surface(scaled["size"], pygame.SRCALPHA)
+    draw_progress(surf, scaled, color, width, 0, int(scaled["ends"][-1] * progress))
     return surf
 
-def render_word_with_progress(word, buf, font, color):
-    """Render word with typed progress, showing underscores for spaces"""
-    # Replace spaces with underscores for display
-    display_word = word.replace(' ', '_')
-    display_buf = buf.replace(' ', '_')
-    
-    ml = len(display_buf) if display_word.startswith(display_buf) else 0
+def render(geometry, size, color, width, progress=1.0):
+    """Render prepared strokes with animation progress"""
+    if not len(geometry["ends"]):
+        surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.rect(surf, color, (0, 0, size, size), width)
+        return surf
     
-    if ml > 0:
-        # Render matched part in green
-        matched = font.render(display_word[:ml], True, GREEN)
-        unmatched = font.render(display_word[ml:], True, color)
-        
-        # Create combined surface
-        total_width = matched.get_width() + unmatched.get_width()
-        total_height = max(matched.get_height(), unmatched.get_height())
-        combined = pygame.Surface((total_width, total_height), pygame.SRCALPHA)
-        
-        combined.blit(matched, (0, 0))
-        combined.blit(unmatched, (matched.get_width(), 0))
-        
-        return combined, ml > 0
-    else:
-        return font.render(display_word, True, color), False
+    return render_progress(scale_strokes(geometry, size, width), color, width, progress)
 
-def build_from_job(job, font):
-    """Build item from a completed job"""
-    d = job.image_data
-    if not d or not d.strokes:
+def make_item(word, drawing, geometry, surf, font):
+    """Wrap a word's doodle surface (or a placeholder box if surf is None) and captions into an item"""
+    if surf is None:
         # Create placeholder if no drawing available
         surf = pygame.Surface((DOODLE_SIZE, DOODLE_SIZE), pygame.SRCALPHA)
         pygame.draw.rect(surf, TEXT, (0, 0, DOODLE_SIZE, DOODLE_SIZE), 2)
-    else:
-        surf = render(d.strokes, DOODLE_SIZE, TEXT, SMALL_W)
+    # Match the display's pixel format once so every redraw takes the fast blit path
+    surf = surf.convert_alpha()
     
-    cap = font.render(job.word.replace(' ', '_'), True, TEXT)
+    display_word = word.replace(' ', '_')
+    cap = font.render(display_word, True, TEXT)
+    cap_green = font.render(display_word, True, GREEN)
     w = max(surf.get_width(), cap.get_width())
     h = surf.get_height() + CAP_PAD + cap.get_height()
+    # Drawing and caption are centred in the item's box; these never change after build
+    offsets = dict(surface=((w - surf.get_width()) // 2, 0),
+                   caption=((w - cap.get_width()) // 2, surf.get_height() + CAP_PAD))
     
-    return dict(word=job.word, drawing=d, surface=surf, caption=cap, bounds=(w, h), pos=(0, 0))
+    return dict(word=word, display_word=display_word, drawing=drawing, geometry=geometry, surface=surf, caption=cap,
+                caption_green=cap_green, prefix_widths={}, offsets=offsets, bounds=(w, h), pos=(0, 0))
 
-def build(word, font):
-    d = get_drawing_async(word)
+def build_from_job(job, font):
+    """Build item from a completed job"""
+    d = job.image_data
     if not d or not d.strokes:
-        # Create placeholder if no drawing available
-        surf = pygame.Surface((DOODLE_SIZE, DOODLE_SIZE), pygame.SRCALPHA)
-        pygame.draw.rect(surf, TEXT, (0, 0, DOODLE_SIZE, DOODLE_SIZE), 2)
+        geometry = surf = None
+    elif job.preview is not None:
+        # Already rendered when the download finished
+        geometry, surf = job.geometry, job.preview
     else:
-        surf = render(d.strokes, DOODLE_SIZE, TEXT, SMALL_W)
-    
-    cap = font.render(word.replace(' ', '_'), True, TEXT)
-    w = max(surf.get_width(), cap.get_width())
-    h = surf.get_height() + CAP_PAD + cap.get_height()
-    
-    return dict(word=word, drawing=d, surface=surf, caption=cap, bounds=(w, h), pos=(0, 0))
+        geometry = prepare_strokes(d.strokes)
+        surf = render(geometry, DOODLE_SIZE, TEXT, SMALL_W)
+    return make_item(job.word, d, geometry, surf, font)
 
-def random_pos(bounds, rects):
+def build(word, font):
+    d = get_drawing_async(word)
+    geometry = surf = None
+    if d and d.strokes:
+        geometry = prepare_strokes(d.strokes)
+        surf = render(geometry, DOODLE_SIZE, TEXT, SMALL_W)
+    return make_item(word, d, geometry, surf, font)
+
+def build_word_trie(words):
+    """Build a dict-of-dicts prefix trie; the "$" key marks a complete word"""
+    trie = {}
+    for word in words:
+        node = trie
+        for c in word:
+            node = node.setdefault(c, {})
+        node["$"] = word
+    return trie
+
+def find_prefix(trie, prefix):
+    """Return the trie node for prefix, or None if no word starts with it"""
+    node = trie
+    for c in prefix:
+        node = node.get(c)
+        if node is None:
+            return None
+    return node
+
+def index_items(items):
+    """Build the prefix trie and word -> index lookup for the items on screen"""
+    words = [it["word"] for it in items]
+    return build_word_trie(words), {word: idx for idx, word in enumerate(words)}
+
+def random_pos(bounds, rects, tries=300):
     bw, bh = bounds
-    for _ in range(300):
-        x = random.randint(PADDING, WIDTH - bw - PADDING)
-        y = random.randint(PADDING, HEIGHT - bh - PADDING)
+    # Draw every candidate up front and test them all against the padded rects at once
+    xs = np.random.randint(PADDING, WIDTH - bw - PADDING + 1, tries)
+    ys = np.random.randint(PADDING, HEIGHT - bh - PADDING + 1, tries)
+    if rects:
+        boxes = np.array([tuple(o.inflate(PADDING, PADDING)) for o in rects])
+        left, top = boxes[:, 0], boxes[:, 1]
+        right, bottom = left + boxes[:, 2], top + boxes[:, 3]
+        # (tries, len(rects)) matrix of AABB overlaps
+        overlap = ((left < xs[:, None] + bw) & (right > xs[:, None]) &
+                   (top < ys[:, None] + bh) & (bottom > ys[:, None]))
+        free = np.flatnonzero(~overlap.any(axis=1))
+    else:
+        free = [0]
+    if len(free):
+        x, y = int(xs[free[0]]), int(ys[free[0]])
+        return (x, y), pygame.Rect(x, y, bw, bh)
+    # Screen is crowded: scan a shuffled grid of cells so any free slot is still found
+    cells = [(x, y)
+             for x in range(PADDING, WIDTH - bw - PADDING + 1, bw + PADDING)
+             for y in range(PADDING, HEIGHT - bh - PADDING + 1, bh + PADDING)]
+    random.shuffle(cells)
+    padded = [o.inflate(PADDING, PADDING) for o in rects]
+    for x, y in cells:
         r = pygame.Rect(x, y, bw, bh)
-        if all(not r.inflate(PADDING, PADDING).colliderect(o) for o in rects):
+        if r.collidelist(padded) == -1:
             return (x, y), r
     return (PADDING, PADDING), pygame.Rect(PADDING, PADDING, bw, bh)
 
@@ -516,7 +630,7 @@ def run_game():
         screen.blit(it["surface"], (x + (it["bounds"][0] - it["surface"].get_width()) // 2, y))
         
         # Draw caption
-        display_cap = font.render(it["word"].replace(' ', '_'), True, TEXT)
+        display_cap = it["caption"]
         cap_x = x + (it["bounds"][0] - display_cap.get_width()) // 2
         cy = y + it["surface"].get_height() + CAP_PAD
         screen.blit(display_cap, (cap_x, cy))
@@ -529,9 +643,8 @@ def run_game():
     resource_manager = None
     pen_sound_loaded = False
     
-    # Start async download worker thread and begin downloads immediately
-    download_thread = threading.Thread(target=download_worker, daemon=True)
-    download_thread.start()
+    # Start the download workers so independent words download in parallel
+    start_download_workers()
     
     try:
         # Create callbacks for audio success/failure
@@ -552,7 +665,8 @@ def run_game():
             create_job(word, resource_manager, visible=True)
         
         # Create 1 backup job (invisible until needed)
-        backup_word = random.choice([w for w in CATEGORIES if w not in selected_words])
+        # The visible words already have jobs, so the pool skips them
+        backup_word = pick_new_word()
         create_job(backup_word, resource_manager, visible=False)
         print(f"🎯 Created 1 backup job: {backup_word}")
         
@@ -571,6 +685,12 @@ def run_game():
     buf = ""
     flash = None
     running = True
+    idle_view = None  # What the idle screen last showed; only redrawn when this changes
+    last_status = -1000  # Time of the last job-level check
+    
+    # Typed-prefix lookups, rebuilt whenever items change
+    word_trie, word_index = index_items(items)
+    buf_node = word_trie  # Trie node for buf, so each keypress is a single dict lookup
     
     # Track which words we've already loaded to prevent duplicates
     loaded_words = set()
@@ -578,8 +698,12 @@ def run_game():
     while running:
         now = pygame.time.get_ticks()
         
+        # Only walk the job queue on frames where some job actually completed or failed
+        jobs_changed = drain_job_events()
+        
         # Clean up any failed jobs and create replacements
-        clean_failed_jobs(resource_manager)
+        if jobs_changed:
+            clean_failed_jobs(resource_manager)
         
         # Conservative job maintenance: Only create jobs if we're genuinely low
         visible_count = get_visible_job_count()
@@ -587,8 +711,9 @@ def run_game():
         total_jobs = visible_count + backup_count
         items_count = len(items)
         
-        # Only check job levels every 60 frames (1 second) to avoid spam
-        if now % 1000 < 17:  # Roughly once per second
+        # Only check job levels once per second to avoid spam
+        if now - last_status >= 1000:
+            last_status = now
             print(f"📊 Status: {items_count} items on screen, {visible_count} visible jobs, {backup_count} backup jobs, {total_jobs} total jobs")
             
             # Fixed logic: Account for items already on screen
@@ -606,23 +731,19 @@ def run_game():
                     # Prioritize backup jobs if we have none
                     create_as_backup = (backup_count == 0)
                     
-                    attempts = 0
-                    while attempts < 10:
-                        new_word = random.choice(CATEGORIES)
-                        if create_job(new_word, resource_manager, visible=not create_as_backup):
-                            if create_as_backup:
-                                backup_count += 1
-                                print(f"🆕 Created needed backup job: {new_word}")
-                            else:
-                                visible_count += 1
-                                print(f"🆕 Created needed visible job: {new_word}")
-                            break
-                        attempts += 1
+                    new_word = pick_new_word()
+                    if new_word and create_job(new_word, resource_manager, visible=not create_as_backup):
+                        if create_as_backup:
+                            backup_count += 1
+                            print(f"🆕 Created needed backup job: {new_word}")
+                        else:
+                            visible_count += 1
+                            print(f"🆕 Created needed visible job: {new_word}")
             else:
                 print(f"✅ Pipeline full ({effective_total}/7), no jobs needed")
         
         # Check for completed jobs (both image and audio ready)
-        completed_jobs = get_completed_jobs(visible_only=True)
+        completed_jobs = get_completed_jobs(visible_only=True) if jobs_changed else []
         for job in completed_jobs:
             if job.word not in loaded_words and len(items) < 5:  # Only add if we have room
                 print(f"✅ Adding completed job: {job.word} (items on screen: {len(items)} → {len(items) + 1})")
@@ -633,6 +754,8 @@ def run_game():
                     items.append(it)
                     rects.append(r)
                     loaded_words.add(job.word)
+                    word_trie, word_index = index_items(items)
+                    buf_node = find_prefix(word_trie, buf) or word_trie
                     
                     # Check if the current buffer matches the newly loaded word
                     if buf and it["word"] == buf:
@@ -655,6 +778,7 @@ def run_game():
                             pygame.mixer.music.play(0, start=start_pos)
                         
                         buf = ""
+                        buf_node = word_trie
                         break
             elif len(items) >= 5:
                 print(f"🚫 Not adding {job.word} - already have {len(items)} items on screen (max 5)")
@@ -663,22 +787,29 @@ def run_game():
                     with job_lock:
                         job.visible = False  # Make it a backup
                         job_queue[job.word] = job
-                        print(f"🔄 Converted {job.word} to backup job")
+                    print(f"🔄 Converted {job.word} to backup job")
         
         for e in pygame.event.get():
             # Handle common events (including ESC key)
             if not handle_common_events(e):
                 running = False
                 break
+            
+            # The window contents may have been lost, so the next frame redraws everything
+            if e.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                idle_view = None
+                if flash:
+                    flash["shown"] = False
                 
             if e.type == pygame.KEYDOWN and not flash:
                 if e.key == pygame.K_BACKSPACE:
                     buf = buf[:-1]
+                    buf_node = find_prefix(word_trie, buf) or word_trie
                 elif e.key == pygame.K_SPACE:
                     # Check if adding space would match any word prefix
-                    test_buf = buf + ' '
-                    if any(it["word"].startswith(test_buf) for it in items):
+                    if ' ' in buf_node:
                         buf += ' '
+                        buf_node = buf_node[' ']
                     else:
                         # Invalid space - play error sound
                         if resource_manager:
@@ -690,36 +821,38 @@ def run_game():
                     c = e.unicode.lower()
                     if c.isalpha():
                         # Check if adding this character would match any word prefix
-                        test_buf = buf + c
-                        if any(it["word"].startswith(test_buf) for it in items):
+                        node = buf_node.get(c)
+                        if node is not None:
                             buf += c
+                            buf_node = node
                             # Check if any word matches exactly
-                            for idx, it in enumerate(items):
-                                if it["word"] == buf:
-                                    draw_speed = random.uniform(0.8, 1.2)
-                                    flash = dict(start=now, item=it, idx=idx, draw_speed=draw_speed)
-                                    
-                                    # Play voice pronunciation
-                                    if resource_manager:
-                                        resource_manager.play_voice(it["word"])
+                            if "$" in node:
+                                idx = word_index[buf]
+                                it = items[idx]
+                                draw_speed = random.uniform(0.8, 1.2)
+                                flash = dict(start=now, item=it, idx=idx, draw_speed=draw_speed)
+                                
+                                # Play voice pronunciation
+                                if resource_manager:
+                                    resource_manager.play_voice(it["word"])
+                                
+                                # Start playing pen sound at random position
+                                if pen_sound_loaded and it["drawing"] and it["drawing"].strokes:
+                                    # Calculate actual drawing duration in seconds
+                                    actual_duration = (FLASH_MS / draw_speed) / 1000.0
+                                    # Choose random start position with enough time left
+                                    max_start = max(0, (SOUND_LENGTH_MS / 1000.0) - actual_duration)
+                                    start_pos = random.uniform(0, max_start)
                                     
-                                    # Start playing pen sound at random position
-                                    if pen_sound_loaded and it["drawing"] and it["drawing"].strokes:
-                                        # Calculate actual drawing duration in seconds
-                                        actual_duration = (FLASH_MS / draw_speed) / 1000.0
-                                        # Choose random start position with enough time left
-                                        max_start = max(0, (SOUND_LENGTH_MS / 1000.0) - actual_duration)
-                                        start_pos = random.uniform(0, max_start)
-                                        
-                                        print(f"Playing sound from position {start_pos:.2f}s for ~{actual_duration:.2f}s")
-                                        
-                                        # Set volume first
-                                        pygame.mixer.music.set_volume(0.8)
-                                        # Play music from that position
-                                        pygame.mixer.music.play(0, start=start_pos)
+                                    print(f"Playing sound from position {start_pos:.2f}s for ~{actual_duration:.2f}s")
                                     
-                                    buf = ""
-                                    break
+                                    # Set volume first
+                                    pygame.mixer.music.set_volume(0.8)
+                                    # Play music from that position
+                                    pygame.mixer.music.play(0, start=start_pos)
+                                
+                                buf = ""
+                                buf_node = word_trie
                         else:
                             # Invalid character - play error sound
                             if resource_manager:
@@ -731,6 +864,8 @@ def run_game():
         
         if flash:
             it = flash["item"]
+            grew = False
+            idle_view = None  # Redraw the idle screen once the flash ends
             elapsed = now - flash["start"]
             # Apply randomized drawing speed
             drawing_prog = min(1, (elapsed * flash["draw_speed"]) / FLASH_MS)
@@ -739,21 +874,39 @@ def run_game():
             total_time = FLASH_MS / flash["draw_speed"] + DISPLAY_MS
             total_prog = elapsed / total_time
             
-            if it["drawing"] and it["drawing"].strokes:
-                # Render with animation progress (capped at 1.0 for drawing)
-                big = render(it["drawing"].strokes, int(HEIGHT * 0.55), TEXT, BIG_W, progress=drawing_prog)
-            else:
-                big = pygame.Surface((int(HEIGHT * 0.55), int(HEIGHT * 0.55)), pygame.SRCALPHA)
-                pygame.draw.rect(big, TEXT, big.get_rect(), BIG_W)
-            
-            screen.fill(BG)
+            if it["geometry"] and len(it["geometry"]["ends"]):
+                # Scale once per flash onto a persistent canvas
+                if "canvas" not in flash:
+                    flash["scaled"] = scale_strokes(it["geometry"], int(HEIGHT * 0.55), BIG_W)
+                    flash["canvas"] = pygame.Surface(flash["scaled"]["size"], pygame.SRCALPHA)
+                    flash["drawn"] = 0
+                # Each frame only draws the points added since the last one (capped at 1.0 for drawing)
+                points = int(flash["scaled"]["ends"][-1] * drawing_prog)
+                if points > flash["drawn"]:
+                    draw_progress(flash["canvas"], flash["scaled"], TEXT, BIG_W, flash["drawn"], points)
+                    flash["drawn"] = points
+                    grew = True
+            elif "canvas" not in flash:
+                flash["canvas"] = pygame.Surface((int(HEIGHT * 0.55), int(HEIGHT * 0.55)), pygame.SRCALPHA)
+                pygame.draw.rect(flash["canvas"], TEXT, flash["canvas"].get_rect(), BIG_W)
+            big = flash["canvas"]
             rect = big.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 40))
-            screen.blit(big, rect)
             
-            cap = font.render(it["word"].replace(' ', '_'), True, TEXT)
-            screen.blit(cap, cap.get_rect(center=(WIDTH // 2, rect.bottom + CAP_PAD + cap.get_height() // 2)))
-            
-            pygame.display.flip()
+            if not flash.get("shown"):
+                # First frame of the flash lays out the whole screen
+                screen.fill(BG)
+                screen.blit(big, rect)
+                
+                # Same text and colour as the caption rendered when the item was built
+                cap = it["caption"]
+                screen.blit(cap, cap.get_rect(center=(WIDTH // 2, rect.bottom + CAP_PAD + cap.get_height() // 2)))
+                
+                pygame.display.flip()
+                flash["shown"] = True
+            elif grew:
+                # Strokes only ever add opaque pixels, so re-blitting the canvas in place is enough
+                screen.blit(big, rect)
+                pygame.display.update(rect)
             
             # Stop music when drawing completes (but keep displaying)
             if drawing_prog >= 1 and not flash.get("music_stopped", False):
@@ -778,55 +931,72 @@ def run_game():
                     print(f"⚡ Using backup job for instant replacement: {backup_job.word}")
                     new_it = build_from_job(backup_job, font)
                     if new_it["drawing"]:
-                        pos, r = random_pos(new_it["bounds"], [pygame.Rect(i["pos"], i["bounds"]) for i in items])
+                        # rects already mirrors items with the finished one popped
+                        pos, r = random_pos(new_it["bounds"], rects)
                         new_it["pos"] = pos
                         items.insert(flash["idx"] if flash["idx"] < len(items) else len(items), new_it)
-                        rects.insert(flash["idx"] if flash["idx"] < len(rects) else len(rects), pygame.Rect(pos, new_it["bounds"]))
+                        rects.insert(flash["idx"] if flash["idx"] < len(rects) else len(rects), r)
                         loaded_words.add(backup_job.word)
                         print(f"📦 Added backup replacement: {backup_job.word} (items on screen: {len(items) - 1} → {len(items)})")
                 else:
                     print(f"⏳ No backup job available for instant replacement")
-                
+                word_trie, word_index = index_items(items)
+                buf_node = find_prefix(word_trie, buf) or word_trie
+
                 # The main loop job maintenance will ensure we have the right number of jobs
                 flash = None
-            
-            clock.tick(60)
-            continue
+        else:
+            # Only redraw when what the idle screen shows has changed
+            view = (buf, [(it["word"], it["pos"]) for it in items])
+            if view != idle_view:
+                idle_view = view
+                
+                screen.fill(BG)
 
-        screen.fill(BG)
-        
-        for it in items:
-            x, y = it["pos"]
-            
-            # Center the drawing
-            screen.blit(it["surface"], (x + (it["bounds"][0] - it["surface"].get_width()) // 2, y))
-            
-            # Draw caption with progress
-            cx = x + (it["bounds"][0] - it["caption"].get_width()) // 2
-            cy = y + it["surface"].get_height() + CAP_PAD
+                # Collect every doodle and caption so they go to the screen in one blits() call
+                draws = []
+                borders = []
+                for it in items:
+                    x, y = it["pos"]
+                    (sx, sy), (cx, cy) = it["offsets"]["surface"], it["offsets"]["caption"]
+
+                    # Center the drawing
+                    draws.append((it["surface"], (x + sx, y + sy)))
+
+                    # Draw caption with progress
+                    cx += x
+                    cy += y
             
-            # Check if current buffer matches this word
-            matches = it["word"].startswith(buf)
+                    # Check if current buffer matches this word
+                    matches = it["word"].startswith(buf)
             
-            if matches and buf:
-                # Render with highlighting
-                rendered_cap, _ = render_word_with_progress(it["word"], buf, font, TEXT)
-                # Center the rendered caption
-                cap_x = x + (it["bounds"][0] - rendered_cap.get_width()) // 2
-                screen.blit(rendered_cap, (cap_x, cy))
-                # Draw green border
-                pygame.draw.rect(screen, GREEN, pygame.Rect(it["pos"], it["bounds"]), 2)
-            else:
-                # Normal caption (with underscores for spaces)
-                display_cap = font.render(it["word"].replace(' ', '_'), True, TEXT)
-                cap_x = x + (it["bounds"][0] - display_cap.get_width()) // 2
-                screen.blit(display_cap, (cap_x, cy))
-        
-        pygame.display.flip()
-        clock.tick(60)
+                    if matches and buf:
+                        # Typed prefix comes from the green caption, the rest from the normal one
+                        ml = len(buf)
+                        prefix_w = it["prefix_widths"].get(ml)
+                        if prefix_w is None:
+                            prefix_w = it["prefix_widths"][ml] = font.size(it["display_word"][:ml])[0]
+                        cap_w, cap_h = it["caption"].get_size()
+                        draws.append((it["caption_green"], (cx, cy), (0, 0, prefix_w, cap_h)))
+                        draws.append((it["caption"], (cx + prefix_w, cy), (prefix_w, 0, cap_w - prefix_w, cap_h)))
+                        # Green border goes on top once everything is blitted
+                        borders.append(pygame.Rect(it["pos"], it["bounds"]))
+                    else:
+                        # Normal caption (with underscores for spaces), rendered at build time
+                        draws.append((it["caption"], (cx, cy)))
+
+                screen.blits(draws, doreturn=False)
+                for border in borders:
+                    pygame.draw.rect(screen, GREEN, border, 2)
+
+                pygame.display.flip()
+
+        # Single tick per frame; the flash animates smoothly, the idle screen just waits for input
+        clock.tick(FPS if flash else IDLE_FPS)
     
-    # Save drawing cache before exit
-    save_drawing_cache()
+    # Stop late download callbacks, then drop downloads that haven't started yet
+    shutting_down.set()
+    cancel_pending_downloads()
     
     # Use game_utils quit instead of pygame.quit() directly
     quit_game()
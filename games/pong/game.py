@@ -15,14 +15,18 @@ import os
 
 # Add path to access root-level modules
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
-from utils import check_screenshot
-from game_utils import handle_common_events, quit_game, COLORS
+from utils import check_screenshot, screenshot_requested
+from game_utils import handle_common_events, allow_only_events, quit_game, COLORS
 
 # Config
 WIDTH, HEIGHT = 1024, 600
 PADDLE_WIDTH, PADDLE_HEIGHT = 20, 100
 BALL_SIZE = 20
+BALL_HALF = BALL_SIZE // 2
+PADDLE1_X = 50
+PADDLE2_X = WIDTH - 50 - PADDLE_WIDTH
 FPS = 60
+THUMBNAIL_PATH = os.path.join(os.path.dirname(__file__), "thumbnail.png")
 
 # Colors (using game_utils colors for consistency)
 BLACK = COLORS['BLACK']
@@ -37,6 +41,14 @@ def run_game():
     # Set up display
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("Pong Easy Mode")
+    allow_only_events()  # Paddle keys are polled with key.get_pressed, not events
+    screenshot_mode = screenshot_requested()
+
+    # Paddle and ball never change, so fill them once and blit every frame
+    paddle_surf = pygame.Surface((PADDLE_WIDTH, PADDLE_HEIGHT)).convert()
+    paddle_surf.fill(WHITE)
+    ball_surf = pygame.Surface((BALL_SIZE, BALL_SIZE)).convert()
+    ball_surf.fill(WHITE)
 
     # Game objects
     paddle1_y = HEIGHT // 2 - PADDLE_HEIGHT // 2
@@ -48,9 +60,18 @@ def run_game():
     score1 = 0
     score2 = 0
 
+    # Font never changes; score text is only re-rendered after a goal
+    font = pygame.font.Font(None, 36)
+    score_text = None
+    score_dirty = True
+
     # Game loop
     clock = pygame.time.Clock()
     running = True
+    
+    # Rects drawn last frame; only these and this frame's rects are pushed to the display
+    dirty = []
+    full_redraw = True
 
     while running:
         
@@ -59,6 +80,9 @@ def run_game():
             if not handle_common_events(event):
                 running = False
                 break
+            # The window contents may have been lost, so repaint everything
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                full_redraw = True
         
         # Simple AI and ball movement (placeholder logic)
         keys = pygame.key.get_pressed()
@@ -77,50 +101,64 @@ def run_game():
         ball_x += ball_dx
         ball_y += ball_dy
 
-        # Rectangles for collision detection
-        paddle1_rect = pygame.Rect(50, paddle1_y, PADDLE_WIDTH, PADDLE_HEIGHT)
-        paddle2_rect = pygame.Rect(WIDTH - 50 - PADDLE_WIDTH, paddle2_y, PADDLE_WIDTH, PADDLE_HEIGHT)
-        ball_rect = pygame.Rect(ball_x - BALL_SIZE // 2, ball_y - BALL_SIZE // 2, BALL_SIZE, BALL_SIZE)
+        # Ball box edges for collision detection (plain ints, no Rect per frame)
+        ball_left = ball_x - BALL_HALF
+        ball_top = ball_y - BALL_HALF
 
-        # Bounce off paddles
-        if ball_rect.colliderect(paddle1_rect) and ball_dx < 0:
+        # Bounce off paddles (same overlap test as Rect.colliderect)
+        if (ball_dx < 0 and ball_left < PADDLE1_X + PADDLE_WIDTH and ball_left + BALL_SIZE > PADDLE1_X
+                and ball_top < paddle1_y + PADDLE_HEIGHT and ball_top + BALL_SIZE > paddle1_y):
             ball_dx = -ball_dx
-            ball_x = paddle1_rect.right + BALL_SIZE // 2
-        if ball_rect.colliderect(paddle2_rect) and ball_dx > 0:
+            ball_x = PADDLE1_X + PADDLE_WIDTH + BALL_HALF
+        if (ball_dx > 0 and ball_left < PADDLE2_X + PADDLE_WIDTH and ball_left + BALL_SIZE > PADDLE2_X
+                and ball_top < paddle2_y + PADDLE_HEIGHT and ball_top + BALL_SIZE > paddle2_y):
             ball_dx = -ball_dx
-            ball_x = paddle2_rect.left - BALL_SIZE // 2
+            ball_x = PADDLE2_X - BALL_HALF
 
         # Ball bouncing off top/bottom
-        if ball_y - BALL_SIZE // 2 <= 0 or ball_y + BALL_SIZE // 2 >= HEIGHT:
+        if ball_y - BALL_HALF <= 0 or ball_y + BALL_HALF >= HEIGHT:
             ball_dy = -ball_dy
         
         # Ball reset (simple scoring)
         if ball_x < 0:
             score2 += 1
+            score_dirty = True
             ball_x = WIDTH // 2
             ball_y = HEIGHT // 2
         elif ball_x > WIDTH:
             score1 += 1
+            score_dirty = True
             ball_x = WIDTH // 2
             ball_y = HEIGHT // 2
 
-        # Draw everything
-        screen.fill(BLACK)
+        # Erase last frame's objects rather than clearing the whole screen
+        if full_redraw:
+            screen.fill(BLACK)
+        else:
+            for rect in dirty:
+                screen.fill(BLACK, rect)
         
-        # Draw paddles
-        pygame.draw.rect(screen, WHITE, (50, paddle1_y, PADDLE_WIDTH, PADDLE_HEIGHT))
-        pygame.draw.rect(screen, WHITE, (WIDTH - 50 - PADDLE_WIDTH, paddle2_y, PADDLE_WIDTH, PADDLE_HEIGHT))
-        
-        # Draw ball
-        pygame.draw.rect(screen, WHITE, (ball_x - BALL_SIZE//2, ball_y - BALL_SIZE//2, BALL_SIZE, BALL_SIZE))
+        # Draw paddles and ball in one batched call
+        drawn = screen.blits([
+            (paddle_surf, (PADDLE1_X, paddle1_y)),
+            (paddle_surf, (PADDLE2_X, paddle2_y)),
+            (ball_surf, (ball_x - BALL_HALF, ball_y - BALL_HALF)),
+        ])
         
         # Draw score
-        font = pygame.font.Font(None, 36)
-        score_text = font.render(f"Score: {score1} - {score2}", True, BLUE)
-        screen.blit(score_text, (10, 10))
-
-        pygame.display.flip()
-        check_screenshot(screen, os.path.join(os.path.dirname(__file__), "thumbnail.png"))
+        if score_dirty:
+            score_text = font.render(f"Score: {score1} - {score2}", True, BLUE)
+            score_dirty = False
+        drawn.append(screen.blit(score_text, (10, 10)))
+
+        if full_redraw:
+            pygame.display.flip()
+            full_redraw = False
+        else:
+            pygame.display.update(dirty + drawn)
+        dirty = drawn
+        if screenshot_mode:
+            check_screenshot(screen, THUMBNAIL_PATH)
         clock.tick(FPS)
 
     # Use game_utils quit instead of pygame.quit() directly
@@ -18,16 +18,27 @@ import pygame
 import sys
 import os
 import random
+from collections import deque
+import numpy as np
 
 # Add path to access root-level modules
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 from utils import screenshot_requested, check_screenshot
-from game_utils import handle_common_events, quit_game, COLORS
+from game_utils import handle_common_events, allow_only_events, quit_game, COLORS
 
 # Config
 WIDTH, HEIGHT = 1024, 600
 CELL_SIZE = 20
 FPS = 10
+THUMBNAIL_PATH = os.path.join(os.path.dirname(__file__), "thumbnail.png")
+
+# Arrow key -> (dx, dy) step for the snake's head
+DIRECTIONS = {
+    pygame.K_UP: (0, -CELL_SIZE),
+    pygame.K_DOWN: (0, CELL_SIZE),
+    pygame.K_LEFT: (-CELL_SIZE, 0),
+    pygame.K_RIGHT: (CELL_SIZE, 0),
+}
 
 # Colors (using game_utils colors for consistency)
 BLACK = COLORS['BLACK']
@@ -35,42 +46,26 @@ GREEN = COLORS['GREEN']
 RED = COLORS['RED']
 BLUE = COLORS['BLUE']
 
+# Waveforms as a function of elapsed cycles (frequency * time), already scaled to volume
+WAVEFORMS = {
+    'sine': lambda cycles: np.sin(2 * np.pi * cycles) * 0.3,
+    'square': lambda cycles: np.where(cycles % 1 < 0.5, 0.2, -0.2),
+    'triangle': lambda cycles: (1 - 4 * np.abs((cycles + 0.25) % 1 - 0.5)) * 0.3,
+}
+
 def create_sound(frequency, duration, wave_type='sine'):
     """Create a sound effect with given frequency, duration and wave type"""
-    try:
-        import numpy as np
-        sample_rate = 22050
-        frames = int(duration * sample_rate)
-        t = np.linspace(0, duration, frames, False)
-        
-        if wave_type == 'sine':
-            wave = np.sin(2 * np.pi * frequency * t) * 0.3
-        elif wave_type == 'square':
-            wave = np.sign(np.sin(2 * np.pi * frequency * t)) * 0.2
-        else:  # triangle
-            wave = 2 * np.arcsin(np.sin(2 * np.pi * frequency * t)) / np.pi * 0.3
-            
-        wave = (wave * 32767).astype(np.int16)
-        stereo_wave = np.column_stack((wave, wave))
-        return pygame.sndarray.make_sound(stereo_wave)
-    except ImportError:
-        # Fallback without numpy
-        duration_ms = int(duration * 1000)
-        sample_rate = 22050
-        frames = int(duration_ms * sample_rate / 1000)
-        sound_buffer = []
-        cycle_length = sample_rate // frequency
-        
-        for i in range(frames):
-            if wave_type == 'square':
-                value = 8192 if (i // (cycle_length // 2)) % 2 else -8192
-            else:  # sine approximation
-                value = int(8192 * ((i % cycle_length) / cycle_length - 0.5) * 2)
-            sound_buffer.extend([value, value])
-        
-        import struct
-        sound_bytes = struct.pack('<%dh' % len(sound_buffer), *sound_buffer)
-        return pygame.mixer.Sound(buffer=sound_bytes)
+    # Generate at the mixer's own rate and channel count; make_sound does no conversion
+    sample_rate, _, channels = pygame.mixer.get_init()
+    frames = int(duration * sample_rate)
+    cycles = np.arange(frames) * (frequency / sample_rate)
+    
+    wave = WAVEFORMS.get(wave_type, WAVEFORMS['triangle'])(cycles)
+    wave = (wave * 32767).astype(np.int16)
+    if channels > 1:
+        # Same samples on every channel
+        wave = np.repeat(wave[:, None], channels, axis=1)
+    return pygame.sndarray.make_sound(wave)
 
 def setup_sounds():
     """Initialize all game sounds"""
@@ -86,9 +81,8 @@ def setup_sounds():
     
     return collision_sound, move_sound, eat_sound
 
-def spawn_food(snake):
-    """Spawn food on the grid, avoiding snake positions and ensuring it's always visible"""
-    # Calculate valid grid positions (ensure food is fully visible)
+def build_food_cells():
+    """Every grid position food may appear at, leaving a margin so it's always fully visible"""
     max_grid_x = (WIDTH - CELL_SIZE) // CELL_SIZE
     max_grid_y = (HEIGHT - CELL_SIZE) // CELL_SIZE
     
@@ -98,42 +92,40 @@ def spawn_food(snake):
     max_x = max(min_x + 1, max_grid_x - 1)
     max_y = max(min_y + 1, max_grid_y - 1)
     
-    attempts = 0
-    while attempts < 100:  # Prevent infinite loop
-        # Generate random grid position within safe bounds
-        grid_x = random.randint(min_x, max_x)
-        grid_y = random.randint(min_y, max_y)
-        
-        food_x = grid_x * CELL_SIZE
-        food_y = grid_y * CELL_SIZE
-        food_pos = (food_x, food_y)
-        
-        # Make sure food doesn't spawn on snake
-        if food_pos not in snake:
+    cells = []
+    for grid_x in range(min_x, max_x + 1):
+        for grid_y in range(min_y, max_y + 1):
+            food_x = grid_x * CELL_SIZE
+            food_y = grid_y * CELL_SIZE
             # Double-check that food is within visible area
-            if (food_x >= 0 and food_x < WIDTH - CELL_SIZE and 
-                food_y >= 0 and food_y < HEIGHT - CELL_SIZE):
-                return food_pos
-        
-        attempts += 1
+            if food_x < WIDTH - CELL_SIZE and food_y < HEIGHT - CELL_SIZE:
+                cells.append((food_x, food_y))
+    return tuple(cells)
+
+FOOD_CELLS = build_food_cells()
+
+def spawn_food(snake_set):
+    """Spawn food on a random free grid cell, avoiding snake positions"""
+    free_cells = [cell for cell in FOOD_CELLS if cell not in snake_set]
+    if free_cells:
+        return random.choice(free_cells)
     
     # Fallback: place food at a safe default position
     safe_x = CELL_SIZE * 5
     safe_y = CELL_SIZE * 5
     return (safe_x, safe_y)
 
-def move_snake(snake, food, direction_key, collision_sound, move_sound, eat_sound):
-    """Helper function to move snake in given direction"""
-    if direction_key == pygame.K_UP:
-        new_head = (snake[0][0], snake[0][1] - CELL_SIZE)
-    elif direction_key == pygame.K_DOWN:
-        new_head = (snake[0][0], snake[0][1] + CELL_SIZE)
-    elif direction_key == pygame.K_LEFT:
-        new_head = (snake[0][0] - CELL_SIZE, snake[0][1])
-    elif direction_key == pygame.K_RIGHT:
-        new_head = (snake[0][0] + CELL_SIZE, snake[0][1])
-    else:
+def move_snake(snake, snake_set, food, direction_key, collision_sound, move_sound, eat_sound):
+    """Helper function to move snake in given direction
+
+    snake is a deque of segments (head first) and snake_set holds the same
+    positions, so occupancy checks are a single hash lookup.
+    """
+    step = DIRECTIONS.get(direction_key)
+    if step is None:
         return False, food, 0
+    head_x, head_y = snake[0]
+    new_head = (head_x + step[0], head_y + step[1])
     
     # Check collision with walls - just block movement and play sound
     if (new_head[0] < 0 or new_head[0] >= WIDTH or
@@ -144,25 +136,26 @@ def move_snake(snake, food, direction_key, collision_sound, move_sound, eat_soun
         return False, food, 0
     
     # Check collision with self - just block movement and play sound
-    if new_head in snake:
+    if new_head in snake_set:
         print("Brrrp! Can't move into yourself!")
         if collision_sound:
             collision_sound.play()
         return False, food, 0
     
     # Valid move - move snake
-    snake.insert(0, new_head)
+    snake.appendleft(new_head)
+    snake_set.add(new_head)
     
     # Check if food eaten
     if new_head == food:
-        food = spawn_food(snake)
+        food = spawn_food(snake_set)
         print(f"Yum! Food eaten!")
         if eat_sound:
             eat_sound.play()
         # Snake grows automatically by not removing tail
         return True, food, 1
     else:
-        snake.pop()  # Remove tail only if no food eaten
+        snake_set.discard(snake.pop())  # Remove tail only if no food eaten
         if move_sound:
             move_sound.play()
         return True, food, 0
@@ -178,6 +171,13 @@ def run_game():
     # Set up display
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("Snake Easy Mode")
+    allow_only_events(pygame.KEYUP)
+
+    # One prefilled cell per colour, in the display's pixel format, blitted instead of drawing rects
+    cell_tiles = {}
+    for color in (GREEN, COLORS['WHITE'], RED):
+        cell_tiles[color] = pygame.Surface((CELL_SIZE, CELL_SIZE)).convert()
+        cell_tiles[color].fill(color)
 
     # Initialize sounds (only if not in screenshot mode)
     if screenshot_mode:
@@ -188,25 +188,36 @@ def run_game():
     # Snake state - make sure snake starts on the grid
     start_x = (WIDTH // 2 // CELL_SIZE) * CELL_SIZE
     start_y = (HEIGHT // 2 // CELL_SIZE) * CELL_SIZE
-    snake = [(start_x, start_y)]
+    snake = deque([(start_x, start_y)])
+    snake_set = {(start_x, start_y)}
     score = 0
 
     # Key holding state (only for normal mode)
     key_held = None
-    key_hold_start = 0
     continuous_mode = False
-    last_move_time = 0
+    next_move_time = 0  # When the held key next moves the snake
     HOLD_THRESHOLD = 500  # ms to start continuous movement
     CONTINUOUS_MOVE_DELAY = 150  # ms between continuous moves
 
     # Food state
-    food = spawn_food(snake)
+    food = spawn_food(snake_set)
+
+    # Font never changes; score text is only re-rendered when the score does
+    font = pygame.font.Font(None, 36)
+    score_text = None
+    rendered_score = None
+    score_rect = pygame.Rect(10, 10, 0, 0)
+
+    # Colour of every cell on screen last frame; only cells that differ get repainted
+    shown_cells = {}
+    full_redraw = True
 
     # Game loop
     clock = pygame.time.Clock()
     running = True
 
     while running:
+        # The one clock read per frame; helpers such as move_snake must not read the clock themselves
         current_time = pygame.time.get_ticks()
         
         for event in pygame.event.get():
@@ -214,19 +225,22 @@ def run_game():
             if not handle_common_events(event):
                 running = False
                 break
+            
+            # The window contents may have been lost, so repaint everything
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                full_redraw = True
                 
             if event.type == pygame.KEYDOWN:
                 # Handle initial key press
-                if event.key in [pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT]:
+                if event.key in DIRECTIONS:
                     # If this is a new key or we're not in continuous mode, move immediately
                     if key_held != event.key or not continuous_mode:
                         key_held = event.key
-                        key_hold_start = current_time
                         continuous_mode = False
-                        last_move_time = current_time
+                        next_move_time = current_time + HOLD_THRESHOLD
                         
                         # Perform the move
-                        moved, food, score_gained = move_snake(snake, food, event.key, collision_sound, move_sound, eat_sound)
+                        moved, food, score_gained = move_snake(snake, snake_set, food, event.key, collision_sound, move_sound, eat_sound)
                         score += score_gained
                                 
             elif event.type == pygame.KEYUP:
@@ -236,37 +250,59 @@ def run_game():
                     continuous_mode = False
         
         # Handle continuous movement when key is held
-        if key_held and current_time - key_hold_start > HOLD_THRESHOLD:
+        if key_held and current_time > next_move_time:
             if not continuous_mode:
                 continuous_mode = True
                 print("Continuous mode activated!")
             
             # Move continuously at intervals
-            if current_time - last_move_time > CONTINUOUS_MOVE_DELAY:
-                last_move_time = current_time
-                moved, food, score_gained = move_snake(snake, food, key_held, collision_sound, move_sound, eat_sound)
-                score += score_gained
+            next_move_time = current_time + CONTINUOUS_MOVE_DELAY
+            moved, food, score_gained = move_snake(snake, snake_set, food, key_held, collision_sound, move_sound, eat_sound)
+            score += score_gained
 
-        # Draw everything
-        screen.fill(BLACK)
-        
-        # Draw snake with white head
-        for i, segment in enumerate(snake):
-            if i == 0:  # Head
-                pygame.draw.rect(screen, COLORS['WHITE'], (segment[0], segment[1], CELL_SIZE, CELL_SIZE))
-            else:  # Body
-                pygame.draw.rect(screen, GREEN, (segment[0], segment[1], CELL_SIZE, CELL_SIZE))
+        # Snake with white head, then food on top
+        cells = dict.fromkeys(snake, GREEN)
+        cells[snake[0]] = COLORS['WHITE']
+        cells[food] = RED
         
-        # Draw food
-        pygame.draw.rect(screen, RED, (food[0], food[1], CELL_SIZE, CELL_SIZE))
+        # Score
+        score_changed = score != rendered_score
+        if score_changed:
+            score_text = font.render(f"Score: {score}", True, BLUE)
+            rendered_score = score
         
-        # Draw score
-        font = pygame.font.Font(None, 36)
-        score_text = font.render(f"Score: {score}", True, BLUE)
-        screen.blit(score_text, (10, 10))
-
-        pygame.display.flip()
-        check_screenshot(screen, os.path.join(os.path.dirname(__file__), "thumbnail.png"))
+        if full_redraw:
+            # Draw everything
+            screen.fill(BLACK)
+            for (x, y), color in cells.items():
+                screen.blit(cell_tiles[color], (x, y))
+            score_rect = screen.blit(score_text, (10, 10))
+            pygame.display.flip()
+            full_redraw = False
+        else:
+            # Only repaint cells that were vacated or changed colour
+            dirty = []
+            for x, y in shown_cells.keys() - cells.keys():
+                dirty.append(screen.fill(BLACK, (x, y, CELL_SIZE, CELL_SIZE)))
+            for (x, y), color in cells.items():
+                if shown_cells.get((x, y)) != color:
+                    dirty.append(screen.blit(cell_tiles[color], (x, y)))
+            
+            # The score sits on top of the cells, so rebuild its area if it or anything under it changed
+            if score_changed or score_rect.collidelist(dirty) != -1:
+                area = score_rect.union(score_text.get_rect(topleft=(10, 10)))
+                screen.fill(BLACK, area)
+                for (x, y), color in cells.items():
+                    if area.colliderect((x, y, CELL_SIZE, CELL_SIZE)):
+                        screen.blit(cell_tiles[color], (x, y))
+                score_rect = screen.blit(score_text, (10, 10))
+                dirty.append(area)
+            
+            if dirty:
+                pygame.display.update(dirty)
+        shown_cells = cells
+        if screenshot_mode:
+            check_screenshot(screen, THUMBNAIL_PATH)
         clock.tick(FPS)
 
     # Use game_utils quit instead of pygame.quit() directly
@@ -9,7 +9,7 @@ Only regenerates thumbnails when game.py has been modified since last generation
 Features:
  - Automatic game discovery in games/ directory
  - Caches file modification times to avoid unnecessary regeneration
- - Launches games with SCREENSHOT_MODE=1 to capture thumbnails
+ - Launches games with SCREENSHOT_MODE=1 to capture thumbnails, several at once
  - Generates 320x240 PNG thumbnails
  - Creates .thumbnail_cache.json to track generation status
 
@@ -30,11 +30,15 @@ import subprocess
 import sys
 import os
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import hashlib
 
 CACHE_FILE = ".thumbnail_cache.json"
 THUMBNAIL_SIZE = (320, 240)
+MAX_WORKERS = 4  # Games captured at the same time
+HASH_ALGO = "blake2b"  # Stored with each entry; entries hashed any other way are regenerated
+HASH_CHUNK_SIZE = 1 << 16  # Bytes read per hash update on Pythons without hashlib.file_digest
 
 class ThumbnailCache:
     """Manages thumbnail generation cache"""
@@ -42,6 +46,7 @@ class ThumbnailCache:
     def __init__(self):
         self.cache_file = Path(CACHE_FILE)
         self.cache = self._load_cache()
+        self._hash_memo = {}  # game.py path -> hash, so each file is read once per run
     
     def _load_cache(self):
         """Load cache from file"""
@@ -52,7 +57,7 @@ class ThumbnailCache:
                 print(f"Warning: Could not load cache file: {e}")
         return {}
     
-    def _save_cache(self):
+    def save(self):
         """Save cache to file"""
         try:
             self.cache_file.write_text(json.dumps(self.cache, indent=2))
@@ -60,11 +65,22 @@ class ThumbnailCache:
             print(f"Warning: Could not save cache file: {e}")
     
     def _get_file_hash(self, file_path):
-        """Get SHA256 hash of file contents"""
-        try:
-            return hashlib.sha256(Path(file_path).read_bytes()).hexdigest()
-        except Exception:
-            return None
+        """Get BLAKE2b hash of file contents (change detection only, so no need for SHA-256)"""
+        key = str(file_path)
+        if key not in self._hash_memo:
+            try:
+                with open(file_path, 'rb') as f:
+                    if hasattr(hashlib, 'file_digest'):  # Python 3.11+ hashes straight from the file
+                        digest = hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=32))
+                    else:
+                        # Feed the hash in blocks so a large file is never held in memory at once
+                        digest = hashlib.blake2b(digest_size=32)
+                        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                            digest.update(chunk)
+            except Exception:
+                return None
+            self._hash_memo[key] = digest.hexdigest()
+        return self._hash_memo[key]
     
     def needs_update(self, game_name, game_py_path, thumbnail_path):
         """Check if thumbnail needs to be generated/updated"""
@@ -83,7 +99,8 @@ class ThumbnailCache:
         
         # Compare with cached hash
         cached_info = self.cache[game_name]
-        return cached_info.get('game_hash') != current_hash
+        return (cached_info.get('hash_algo') != HASH_ALGO or
+                cached_info.get('game_hash') != current_hash)
     
     def mark_generated(self, game_name, game_py_path, thumbnail_path):
         """Mark thumbnail as generated for given game"""
@@ -91,10 +108,10 @@ class ThumbnailCache:
         if game_hash:
             self.cache[game_name] = {
                 'game_hash': game_hash,
+                'hash_algo': HASH_ALGO,
                 'thumbnail_path': str(thumbnail_path),
                 'generated_at': str(Path(thumbnail_path).stat().st_mtime) if Path(thumbnail_path).exists() else None
             }
-            self._save_cache()
     
     def clear_cache(self):
         """Clear all cache entries"""
@@ -148,19 +165,19 @@ def generate_thumbnail(game_info):
                 print(f"✓ Thumbnail generated: {game_info['thumbnail_path']}")
                 return True
             else:
-                print(f"✗ Game ran successfully but no thumbnail was created")
+                print(f"✗ {game_info['name']} ran successfully but no thumbnail was created")
                 return False
         else:
-            print(f"✗ Game failed to run (exit code {result.returncode})")
+            print(f"✗ {game_info['name']} failed to run (exit code {result.returncode})")
             if result.stderr:
                 print(f"  Error: {result.stderr.strip()}")
             return False
             
     except subprocess.TimeoutExpired:
-        print(f"✗ Game timed out after 30 seconds")
+        print(f"✗ {game_info['name']} timed out after 30 seconds")
         return False
     except Exception as e:
-        print(f"✗ Error running game: {e}")
+        print(f"✗ Error running {game_info['name']}: {e}")
         return False
 
 def clean_thumbnails(games):
@@ -215,6 +232,7 @@ def main():
     skipped_count = 0
     failed_count = 0
     
+    games_to_build = []
     for game in games:
         # Check if we need to generate thumbnail
         if not args.force and not cache.needs_update(
@@ -223,13 +241,24 @@ def main():
             print(f"⏭  Skipping {game['name']}: thumbnail up to date")
             skipped_count += 1
             continue
-        
-        # Generate thumbnail
-        if generate_thumbnail(game):
-            cache.mark_generated(game['name'], game['game_py'], game['thumbnail_path'])
-            generated_count += 1
-        else:
-            failed_count += 1
+        games_to_build.append(game)
+    
+    # Each game runs in its own process, so capture them side by side
+    if games_to_build:
+        try:
+            with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(games_to_build))) as executor:
+                futures = {executor.submit(generate_thumbnail, game): game for game in games_to_build}
+                for future in as_completed(futures):
+                    game = futures[future]
+                    # Cache is only touched here, on the main thread
+                    if future.result():
+                        cache.mark_generated(game['name'], game['game_py'], game['thumbnail_path'])
+                        generated_count += 1
+                    else:
+                        failed_count += 1
+        finally:
+            # Written once, keeping whatever finished even if the run is interrupted
+            cache.save()
     
     # Summary
     print(f"\n📊 Summary:")
@@ -39,6 +39,7 @@ WINDOW_WIDTH = 1024
 WINDOW_HEIGHT = 600
 THUMBNAIL_SIZE = (280, 210)  # Larger thumbnails for better visibility
 PREVIEW_SIZE = (350, 260)    # Main preview size (slightly smaller to fit better)
+SIDE_THUMB_SIZE = (60, 45)   # Smaller side thumbnails
 
 # Cheerful Colors
 SKY_BLUE = (135, 206, 250)
@@ -51,6 +52,7 @@ PINK = (255, 192, 203)
 PURPLE = (147, 112, 219)
 DARK_BLUE = (25, 25, 112)
 SHADOW_GRAY = (0, 0, 0, 50)  # Semi-transparent for shadows
+SHADOW_DROP = 6  # How far the preview's shadow sits below and right of its card
 
 # Animation settings
 SCALE_SPEED = 0.1
@@ -65,45 +67,45 @@ class GameInfo:
         self.thumbnail = thumbnail
         self.display_name = self.name.replace('_', ' ').title()
         
+        # Side thumbnails never change size, so scale them once
+        self.side_thumbnail = pygame.transform.scale(thumbnail, SIDE_THUMB_SIZE) if thumbnail else None
+        
+        # Last preview scaled for the bounce animation, reused while its size holds
+        self._preview = None
+        self._preview_size = None
+        
         # Animation properties
         self.scale = 1.0
         self.target_scale = 1.0
         self.bounce_offset = 0
         self.bounce_speed = 0
+    
+    def get_preview(self, size):
+        """Return the thumbnail scaled to size, rescaling only when the size changes"""
+        if size != self._preview_size:
+            self._preview = pygame.transform.scale(self.thumbnail, size)
+            self._preview_size = size
+        return self._preview
 
 def create_gradient_background(width, height):
     """Create a beautiful sky gradient background"""
-    background = pygame.Surface((width, height))
-    
-    # Create vertical gradient from sky blue to light blue
+    # Paint the vertical gradient into a single-pixel-wide column, then let SDL stretch it
+    column = pygame.Surface((1, height))
     for y in range(height):
         # Calculate color blend ratio
         ratio = y / height
         r = int(SKY_BLUE[0] * (1 - ratio) + LIGHT_BLUE[0] * ratio)
         g = int(SKY_BLUE[1] * (1 - ratio) + LIGHT_BLUE[1] * ratio)
         b = int(SKY_BLUE[2] * (1 - ratio) + LIGHT_BLUE[2] * ratio)
-        
-        pygame.draw.line(background, (r, g, b), (0, y), (width, y))
+        column.set_at((0, y), (r, g, b))
     
-    return background
+    return pygame.transform.scale(column, (width, height))
 
-def draw_rounded_rect(surface, color, rect, corner_radius):
-    """Draw a rounded rectangle (simplified version)"""
-    # Draw main rectangle
-    pygame.draw.rect(surface, color, rect)
-    
-    # Draw corner circles to create rounded effect
-    x, y, w, h = rect
-    pygame.draw.circle(surface, color, (x + corner_radius, y + corner_radius), corner_radius)
-    pygame.draw.circle(surface, color, (x + w - corner_radius, y + corner_radius), corner_radius)
-    pygame.draw.circle(surface, color, (x + corner_radius, y + h - corner_radius), corner_radius)
-    pygame.draw.circle(surface, color, (x + w - corner_radius, y + h - corner_radius), corner_radius)
-
-def draw_shadow(surface, rect, offset=5):
-    """Draw a soft shadow behind a rectangle"""
-    shadow_surf = pygame.Surface((rect.width + offset * 2, rect.height + offset * 2), pygame.SRCALPHA)
-    shadow_rect = pygame.Rect(offset, offset, rect.width, rect.height)
-    draw_rounded_rect(shadow_surf, SHADOW_GRAY, shadow_rect, 10)
+def create_shadow(size, offset=5):
+    """Build a soft shadow for a rectangle of the given size (the blur is slow, so do this once)"""
+    shadow_surf = pygame.Surface((size[0] + offset * 2, size[1] + offset * 2), pygame.SRCALPHA)
+    shadow_rect = pygame.Rect(offset, offset, size[0], size[1])
+    pygame.draw.rect(shadow_surf, SHADOW_GRAY, shadow_rect, border_radius=10)
     
     # Blur effect (simplified)
     for i in range(3):
@@ -114,15 +116,23 @@ def draw_shadow(surface, rect, offset=5):
                                                   (shadow_surf.get_width(), 
                                                    shadow_surf.get_height()))
     
-    surface.blit(shadow_surf, (rect.x - offset, rect.y - offset))
+    return shadow_surf.convert_alpha()
+
+def draw_shadow(surface, rect, shadow, offset=5):
+    """Draw a shadow from create_shadow behind a rectangle, stretching it if the sizes differ"""
+    size = (rect.width + offset * 2, rect.height + offset * 2)
+    if shadow.get_size() != size:
+        # Plain scale is plenty for a blurred edge and much cheaper than smoothscale
+        shadow = pygame.transform.scale(shadow, size)
+    surface.blit(shadow, (rect.x - offset, rect.y - offset))
 
 def create_fun_thumbnail(size, game_name):
     """Create a colorful placeholder thumbnail with game name"""
-    surface = pygame.Surface(size)
+    surface = pygame.Surface(size).convert()
     
     # Bright colorful background based on game name
     colors = [BRIGHT_GREEN, SUNNY_YELLOW, ORANGE, PINK, PURPLE]
-    color_index = hash(game_name) % len(colors)
+    color_index = sum(game_name.encode()) % len(colors)  # Same color every run, unlike hash()
     background_color = colors[color_index]
     
     surface.fill(background_color)
@@ -151,32 +161,33 @@ def discover_games():
         print("Warning: games/ directory not found!")
         return games
     
-    for game_dir in games_dir.iterdir():
-        if not game_dir.is_dir():
-            continue
-            
+    # scandir already knows which entries are directories, so that costs no extra stat
+    with os.scandir(games_dir) as entries:
+        game_dirs = [Path(entry.path) for entry in entries if entry.is_dir()]
+    
+    for game_dir in game_dirs:
         game_py = game_dir / "game.py"
         if not game_py.exists():
             continue
         
-        # Load description
+        # Load description (optional; a missing file just fails to open)
         description_file = game_dir / "description.txt"
         description = ""
-        if description_file.exists():
-            try:
-                description = description_file.read_text().strip()
-            except Exception:
-                pass
+        try:
+            description = description_file.read_text().strip()
+        except Exception:
+            pass
         
-        # Load thumbnail
+        # Load thumbnail (optional; a missing file just fails to load)
         thumbnail_file = game_dir / "thumbnail.png"
         thumbnail = None
-        if thumbnail_file.exists():
-            try:
-                thumbnail = pygame.image.load(str(thumbnail_file))
-                thumbnail = pygame.transform.scale(thumbnail, THUMBNAIL_SIZE)
-            except Exception:
-                pass
+        try:
+            # Match the display's pixel format so blits don't convert every frame;
+            # the scaled side/preview copies inherit it
+            thumbnail = pygame.image.load(str(thumbnail_file)).convert()
+            thumbnail = pygame.transform.scale(thumbnail, THUMBNAIL_SIZE)
+        except Exception:
+            pass
         
         # Create fun placeholder if no thumbnail
         if thumbnail is None:
@@ -209,6 +220,7 @@ def main():
     # Initialize ResourceManager for sounds
     try:
         resources = ResourceManager()
+        resources.preload_sounds(["click_001", "confirmation_001", "minimize_006"])
     except Exception as e:
         print(f"Warning: Could not initialize ResourceManager: {e}")
         resources = None
@@ -221,18 +233,26 @@ def main():
     # Create background
     background = create_gradient_background(WINDOW_WIDTH, WINDOW_HEIGHT)
     
+    # Blur the preview's shadow once at full size; the bounce only stretches it
+    preview_shadow = create_shadow((PREVIEW_SIZE[0] + 10, PREVIEW_SIZE[1] + 10))
+    
     # Load fun fonts (adjusted sizes for better layout)
     title_font = pygame.font.Font(None, 56)      # Smaller title
     game_name_font = pygame.font.Font(None, 42)  # Game names
     instruction_font = pygame.font.Font(None, 32) # Instructions
     small_font = pygame.font.Font(None, 24)      # Small text
     
+    # Text that never changes is rendered once, not every frame
+    title_text = title_font.render("Tiny Top Games", True, DARK_BLUE)
+    
     # Discover games
     games = discover_games()
     
     if not games:
         # Show "no games" message with friendly graphics
         no_games_font = pygame.font.Font(None, 48)
+        msg_text = no_games_font.render("No games found!", True, DARK_BLUE)
+        help_text = instruction_font.render("Add games to the games/ folder!", True, DARK_BLUE)
         while True:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -250,33 +270,41 @@ def main():
             screen.blit(background, (0, 0))
             
             # Friendly "no games" message
-            title_text = title_font.render("Tiny Top Games", True, DARK_BLUE)
             title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, 150))
             screen.blit(title_text, title_rect)
             
-            msg_text = no_games_font.render("No games found!", True, DARK_BLUE)
             msg_rect = msg_text.get_rect(center=(WINDOW_WIDTH // 2, 300))
             screen.blit(msg_text, msg_rect)
             
-            help_text = instruction_font.render("Add games to the games/ folder!", True, DARK_BLUE)
             help_rect = help_text.get_rect(center=(WINDOW_WIDTH // 2, 350))
             screen.blit(help_text, help_rect)
             
             pygame.display.flip()
             clock.tick(60)
     
+    # Menu text, including every game name and "Game N of M" line up front
+    play_text = instruction_font.render("Press ENTER to Play!", True, BRIGHT_GREEN)
+    nav_text = instruction_font.render("LEFT/RIGHT - Choose Game", True, ORANGE)
+    exit_text = small_font.render("Press ESC to exit", True, DARK_BLUE)
+    name_texts = [game_name_font.render(game.display_name, True, DARK_BLUE) for game in games]
+    count_texts = [small_font.render(f"Game {i + 1} of {len(games)}", True, DARK_BLUE) for i in range(len(games))]
+    
     # Menu state
     selected_index = 0
     
     # Animation timing
     bounce_timer = 0
     
+    # Selection and preview size on screen now; a frame that matches it is not redrawn
+    drawn_state = None
+    
     running = True
     while running:
         dt = clock.tick(60) / 1000.0  # Delta time in seconds
         bounce_timer += dt * 2  # Bounce speed (reduced)
         
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 if resources:
                     resources.play_sound("minimize_006")
@@ -309,61 +337,63 @@ def main():
             # Set target scale based on selection
             if i == selected_index:
                 game.target_scale = 1.0 + math.sin(bounce_timer) * BOUNCE_AMOUNT
-            else:
+            elif abs(game.scale - 0.8) > 1e-3:
                 game.target_scale = 0.8
+            else:
+                continue  # Unselected and already settled, nothing left to animate
             
             # Smooth scale transition
             game.scale += (game.target_scale - game.scale) * SCALE_SPEED
         
+        selected_game = games[selected_index]
+        preview_size = (int(PREVIEW_SIZE[0] * selected_game.scale), 
+                       int(PREVIEW_SIZE[1] * selected_game.scale))
+        
+        # The bounce only moves whole pixels every few frames; skip frames where nothing
+        # visible changed (any event, e.g. returning from a game, forces a redraw)
+        if not events and drawn_state == (selected_index, preview_size):
+            continue
+        drawn_state = (selected_index, preview_size)
+        
         # Draw everything
         screen.blit(background, (0, 0))
         
         # Draw title with fun styling (positioned higher and smaller)
-        title_text = title_font.render("Tiny Top Games", True, DARK_BLUE)
         title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, 40))
         screen.blit(title_text, title_rect)
         
         if games:
-            selected_game = games[selected_index]
-            
             # Draw main game preview (large, centered, positioned better)
-            preview_size = (int(PREVIEW_SIZE[0] * selected_game.scale), 
-                           int(PREVIEW_SIZE[1] * selected_game.scale))
-            preview_thumbnail = pygame.transform.scale(selected_game.thumbnail, preview_size)
+            preview_thumbnail = selected_game.get_preview(preview_size)
             preview_rect = preview_thumbnail.get_rect(center=(WINDOW_WIDTH // 2, 200))
             
-            # Draw shadow behind preview
-            shadow_rect = pygame.Rect(preview_rect.x - 5, preview_rect.y - 5, 
-                                    preview_rect.width + 10, preview_rect.height + 10)
-            draw_shadow(screen, shadow_rect)
+            # Draw shadow behind preview, dropped down-right so it shows past the card
+            shadow_rect = preview_rect.inflate(10, 10).move(SHADOW_DROP, SHADOW_DROP)
+            draw_shadow(screen, shadow_rect, preview_shadow)
             
             # Draw white background with rounded corners
-            bg_rect = pygame.Rect(preview_rect.x - 10, preview_rect.y - 10,
-                                preview_rect.width + 20, preview_rect.height + 20)
-            draw_rounded_rect(screen, WHITE, bg_rect, 15)
+            bg_rect = preview_rect.inflate(20, 20)
+            pygame.draw.rect(screen, WHITE, bg_rect, border_radius=15)
             
             # Draw the game thumbnail
             screen.blit(preview_thumbnail, preview_rect)
             
             # Draw game name (positioned below preview)
-            name_text = game_name_font.render(selected_game.display_name, True, DARK_BLUE)
+            name_text = name_texts[selected_index]
             name_rect = name_text.get_rect(center=(WINDOW_WIDTH // 2, 350))
             screen.blit(name_text, name_rect)
             
             # Draw fun "Press ENTER to Play!" instruction
-            play_text = instruction_font.render("Press ENTER to Play!", True, BRIGHT_GREEN)
             play_rect = play_text.get_rect(center=(WINDOW_WIDTH // 2, 385))
             screen.blit(play_text, play_rect)
             
             # Draw navigation hints (only if multiple games)
             if len(games) > 1:
-                nav_text = instruction_font.render("LEFT/RIGHT - Choose Game", True, ORANGE)
                 nav_rect = nav_text.get_rect(center=(WINDOW_WIDTH // 2, 420))
                 screen.blit(nav_text, nav_rect)
             
             # Draw small thumbnails of other games at the bottom (only if multiple games)
             if len(games) > 1:
-                side_size = (60, 45)  # Smaller side thumbnails
                 y_pos = 460
                 spacing = 80
                 
@@ -378,24 +408,22 @@ def main():
                 for i, game in enumerate(visible_other_games):
                     x_pos = start_x + i * spacing
                     
-                    small_thumb = pygame.transform.scale(game.thumbnail, side_size)
+                    small_thumb = game.side_thumbnail
                     thumb_rect = small_thumb.get_rect(center=(x_pos, y_pos))
                     
-                    # Draw small background
-                    bg_rect = pygame.Rect(thumb_rect.x - 3, thumb_rect.y - 3,
-                                        thumb_rect.width + 6, thumb_rect.height + 6)
-                    draw_rounded_rect(screen, WHITE, bg_rect, 5)
+                    # Draw small rounded background
+                    bg_rect = thumb_rect.inflate(6, 6)
+                    pygame.draw.rect(screen, WHITE, bg_rect, border_radius=5)
                     
                     screen.blit(small_thumb, thumb_rect)
             
             # Show game count if multiple games
             if len(games) > 1:
-                count_text = small_font.render(f"Game {selected_index + 1} of {len(games)}", True, DARK_BLUE)
+                count_text = count_texts[selected_index]
                 count_rect = count_text.get_rect(center=(WINDOW_WIDTH // 2, 520))
                 screen.blit(count_text, count_rect)
         
         # Draw exit instruction
-        exit_text = small_font.render("Press ESC to exit", True, DARK_BLUE)
         screen.blit(exit_text, (10, WINDOW_HEIGHT - 30))
         
         pygame.display.flip()
@@ -1,9 +1,12 @@
 # ResourceManager.py
 import pygame
 import os
+import json
+import hashlib
 import requests
 import threading
 import queue
+from collections import OrderedDict
 from pathlib import Path
 try:
     from dotenv import load_dotenv
@@ -11,17 +14,21 @@ try:
 except ImportError:
     print("⚠️ python-dotenv not installed. Using system environment variables only.")
 
+MAX_VOICE_SOUNDS = 64  # Decoded voice clips kept in memory; least recently played go first
+
 class ResourceManager:
     def __init__(self, audio_ready_callback=None, audio_failed_callback=None):
         self.sounds = {}
         self.images = {}
         self.fonts = {}
-        self.voices = {}
+        self.voices = OrderedDict()  # word -> Sound, in order of last play
         self.base_path = os.path.dirname(__file__)
         self.sounds_path = os.path.join(self.base_path, "sounds")
         self.images_path = os.path.join(self.base_path, "images")
         self.fonts_path = os.path.join(self.base_path, "fonts")
         self.voice_path = os.path.join(self.base_path, "voice")
+        self.debug = os.environ.get("TINYTOP_DEBUG") == "1"  # Verbose loading output
+        self.sound_files = self._index_sounds()
         
         # Create voice directory if it doesn't exist
         Path(self.voice_path).mkdir(exist_ok=True)
@@ -29,6 +36,7 @@ class ResourceManager:
         # Voice generation system
         self.voice_queue = queue.Queue()
         self.voice_cache = {}
+        self.voice_queued = set()  # Words waiting for the worker, so each is only generated once
         self.voice_lock = threading.Lock()
         self.voice_worker_running = False
         self.audio_ready_callback = audio_ready_callback
@@ -38,6 +46,14 @@ class ResourceManager:
         self.api_key = os.getenv('ELEVENLABS_API_KEY')
         self.voice_name = 'Annie'
         self.voice_id = None
+        self.voice_id_file = os.path.join(self.base_path, ".voice_id.json")  # voice name + key hash -> ID from earlier runs
+        # IDs are per account, so saved ones are only reused with the same API key
+        key_hash = hashlib.sha256((self.api_key or '').encode()).hexdigest()[:12]
+        self.voice_id_key = f"{self.voice_name}:{key_hash}"
+        
+        # One keep-alive connection for all API calls (only the voice worker uses it)
+        self.session = requests.Session()
+        self.session.headers.update({'xi-api-key': self.api_key})
         
         # Start voice worker if API key is available
         if self.api_key:
@@ -46,30 +62,50 @@ class ResourceManager:
             print("⚠️ ELEVENLABS_API_KEY not found in environment variables")
 
     def play_sound(self, name):
+        sound = self.get_sound(name)
+        if sound:
+            sound.play()
+        return sound
+
+    def get_sound(self, name):
+        """Return the loaded pygame Sound for name, or None if it can't be found"""
         if name not in self.sounds:
             self._load_sound(name)
-        if name in self.sounds:
-            self.sounds[name].play()
+        return self.sounds.get(name)
+
+    def _index_sounds(self):
+        """Map each sound name to its file with one directory scan, preferring WAV over OGG"""
+        sound_files = {}
+        try:
+            with os.scandir(self.sounds_path) as entries:
+                for entry in entries:
+                    name, ext = os.path.splitext(entry.name)
+                    if ext == ".wav" or (ext == ".ogg" and name not in sound_files):
+                        sound_files[name] = entry.path
+        except OSError as e:
+            print(f"⚠️ Could not read sounds folder: {e}")
+        return sound_files
 
     def _load_sound(self, name):
-        path_wav = os.path.join(self.sounds_path, f"{name}.wav")
-        path_ogg = os.path.join(self.sounds_path, f"{name}.ogg")
+        path = self.sound_files.get(name)
         
-        # Debug: print the paths being checked
-        print(f"Looking for sound '{name}' in:")
-        print(f"  WAV: {path_wav}")
-        print(f"  OGG: {path_ogg}")
+        # Debug: print the lookup result
+        if self.debug:
+            print(f"Looking for sound '{name}' in {self.sounds_path}: {path}")
         
-        if os.path.exists(path_wav):
-            print(f"✓ Loading WAV: {path_wav}")
-            self.sounds[name] = pygame.mixer.Sound(path_wav)
-        elif os.path.exists(path_ogg):
-            print(f"✓ Loading OGG: {path_ogg}")
-            self.sounds[name] = pygame.mixer.Sound(path_ogg)
+        if path:
+            if self.debug:
+                print(f"✓ Loading: {path}")
+            self.sounds[name] = pygame.mixer.Sound(path)
         else:
             print(f"⚠️ Sound not found: {name}")
             print(f"   Searched in: {self.sounds_path}")
 
+    def preload_sounds(self, names):
+        """Load sounds up front so their first play doesn't wait on disk"""
+        for name in names:
+            self.get_sound(name)
+
     # (Optional) extend later:
     def load_image(self, name):
         if name not in self.images:
@@ -92,16 +128,10 @@ class ResourceManager:
     
     def get_sound_path(self, name):
         """Get the full path to a sound file for manual loading (e.g., pygame.mixer.music)"""
-        path_wav = os.path.join(self.sounds_path, f"{name}.wav")
-        path_ogg = os.path.join(self.sounds_path, f"{name}.ogg")
-        
-        if os.path.exists(path_wav):
-            return path_wav
-        elif os.path.exists(path_ogg):
-            return path_ogg
-        else:
+        path = self.sound_files.get(name)
+        if path is None:
             print(f"⚠️ Sound path not found: {name}")
-            return None
+        return path
     
     def _start_voice_worker(self):
         """Start the background voice generation worker"""
@@ -111,24 +141,59 @@ class ResourceManager:
             self.voice_thread.start()
             print("🎤 Voice worker started")
     
+    def _load_voice_ids(self):
+        """Load the voice IDs looked up on earlier runs"""
+        try:
+            with open(self.voice_id_file) as f:
+                voice_ids = json.load(f)
+        except Exception:
+            return {}
+        return voice_ids if isinstance(voice_ids, dict) else {}
+    
+    def _write_voice_ids(self, voice_ids):
+        """Write the saved voice IDs back to disk"""
+        try:
+            with open(self.voice_id_file, 'w') as f:
+                json.dump(voice_ids, f, indent=2)
+        except Exception as e:
+            print(f"⚠️ Could not save voice ID: {e}")
+    
+    def _save_voice_id(self):
+        """Remember the voice ID so later runs can skip the voices API call"""
+        voice_ids = self._load_voice_ids()
+        voice_ids[self.voice_id_key] = self.voice_id
+        self._write_voice_ids(voice_ids)
+    
+    def _forget_voice_id(self):
+        """Drop the current voice ID (memory and disk) so the next lookup asks the API"""
+        self.voice_id = None
+        voice_ids = self._load_voice_ids()
+        if voice_ids.pop(self.voice_id_key, None) is not None:
+            self._write_voice_ids(voice_ids)
+    
     def _get_voice_id(self):
         """Get the voice ID for the specified voice name"""
         if self.voice_id:
             return self.voice_id
+        
+        self.voice_id = self._load_voice_ids().get(self.voice_id_key)
+        if self.voice_id:
+            print(f"✓ Using saved voice '{self.voice_name}': {self.voice_id}")
+            return self.voice_id
             
         try:
-            headers = {'xi-api-key': self.api_key}
-            response = requests.get('https://api.elevenlabs.io/v1/voices', headers=headers)
+            response = self.session.get('https://api.elevenlabs.io/v1/voices')
             response.raise_for_status()
             voices = response.json()
             
-            for voice in voices['voices']:
-                if voice['name'].lower() == self.voice_name.lower():
-                    self.voice_id = voice['voice_id']
-                    print(f"✓ Found voice '{self.voice_name}': {self.voice_id}")
-                    return self.voice_id
+            voice_ids = {voice['name'].lower(): voice['voice_id'] for voice in voices['voices']}
+            self.voice_id = voice_ids.get(self.voice_name.lower())
+            if self.voice_id:
+                print(f"✓ Found voice '{self.voice_name}': {self.voice_id}")
+                self._save_voice_id()
+                return self.voice_id
             
-            # Fallback to first voice
+            # Fallback to first voice (not saved, so the named voice is picked up once it exists)
             self.voice_id = voices['voices'][0]['voice_id']
             print(f"⚠️ Voice '{self.voice_name}' not found, using default: {self.voice_id}")
             return self.voice_id
@@ -137,10 +202,44 @@ class ResourceManager:
             print(f"❌ Error getting voice ID: {e}")
             return None
     
-    def _voice_worker(self):
-        """Background worker for generating voice audio"""
+    def _post_voice(self, voice_id, word):
+        """Send one text-to-speech request for word"""
+        url = f'https://api.elevenlabs.io/v1/text-to-speech/{voice_id}'
+        headers = {
+            'Content-Type': 'application/json',
+            'Accept': 'audio/wav'
+        }
+        data = {
+            'text': word,
+            'model_id': 'eleven_multilingual_v2',
+            'voice_settings': {
+                'stability': 0.8,  # Slightly faster generation
+                'similarity_boost': 0.8
+            }
+        }
+        return self.session.post(url, headers=headers, json=data)
+    
+    def _request_voice(self, word):
+        """Generate audio for word, looking the voice ID up again once if it stopped working"""
         voice_id = self._get_voice_id()
         if not voice_id:
+            raise RuntimeError(f"no voice ID for '{self.voice_name}'")
+        response = self._post_voice(voice_id, word)
+        
+        # A saved ID can go stale (voice deleted/renamed, or a key for another account)
+        if response.status_code in (401, 404):
+            print(f"⚠️ Voice ID {voice_id} was rejected ({response.status_code}), looking it up again")
+            self._forget_voice_id()
+            new_voice_id = self._get_voice_id()
+            if new_voice_id and new_voice_id != voice_id:
+                response = self._post_voice(new_voice_id, word)
+        
+        response.raise_for_status()
+        return response
+    
+    def _voice_worker(self):
+        """Background worker for generating voice audio"""
+        if not self._get_voice_id():
             return
             
         while True:
@@ -157,6 +256,7 @@ class ResourceManager:
                     print(f"✓ Voice already exists: {word}")
                     with self.voice_lock:
                         self.voice_cache[word] = voice_file
+                        self.voice_queued.discard(word)
                     
                     # Notify job system that audio is ready (even if it already existed)
                     if self.audio_ready_callback:
@@ -166,23 +266,7 @@ class ResourceManager:
                     continue
                 
                 # Generate voice using ElevenLabs API
-                url = f'https://api.elevenlabs.io/v1/text-to-speech/{voice_id}'
-                headers = {
-                    'xi-api-key': self.api_key,
-                    'Content-Type': 'application/json',
-                    'Accept': 'audio/wav'
-                }
-                data = {
-                    'text': word,
-                    'model_id': 'eleven_multilingual_v2',
-                    'voice_settings': {
-                        'stability': 0.8,  # Slightly faster generation
-                        'similarity_boost': 0.8
-                    }
-                }
-                
-                response = requests.post(url, headers=headers, json=data)
-                response.raise_for_status()
+                response = self._request_voice(word)
                 
                 # Save the audio file
                 with open(voice_file, 'wb') as f:
@@ -190,6 +274,7 @@ class ResourceManager:
                 
                 with self.voice_lock:
                     self.voice_cache[word] = voice_file
+                    self.voice_queued.discard(word)
                 
                 print(f"✓ Generated voice: {word}")
                 
@@ -203,11 +288,24 @@ class ResourceManager:
                 continue
             except Exception as e:
                 print(f"❌ Error generating voice for '{word}': {e}")
+                # Let a later request try this word again
+                with self.voice_lock:
+                    self.voice_queued.discard(word)
                 # Notify job system that audio failed
                 if self.audio_failed_callback:
                     self.audio_failed_callback(word)
                 self.voice_queue.task_done()
     
+    def _get_voice_sound(self, word, voice_file):
+        """Return the Sound for a voice word, loading it if it isn't one of the recently played"""
+        if word in self.voices:
+            self.voices.move_to_end(word)
+        else:
+            self.voices[word] = pygame.mixer.Sound(voice_file)
+            if len(self.voices) > MAX_VOICE_SOUNDS:
+                self.voices.popitem(last=False)
+        return self.voices[word]
+    
     def play_voice(self, word):
         """Play a voice for the given word. Generates if not available."""
         if not self.api_key:
@@ -220,9 +318,7 @@ class ResourceManager:
         # Check if file exists locally
         if os.path.exists(voice_file):
             try:
-                if word not in self.voices:
-                    self.voices[word] = pygame.mixer.Sound(voice_file)
-                self.voices[word].play()
+                self._get_voice_sound(word, voice_file).play()
                 print(f"🔊 Playing voice: {word}")
                 return True
             except Exception as e:
@@ -233,15 +329,17 @@ class ResourceManager:
         with self.voice_lock:
             if word in self.voice_cache:
                 try:
-                    if word not in self.voices:
-                        self.voices[word] = pygame.mixer.Sound(self.voice_cache[word])
-                    self.voices[word].play()
+                    self._get_voice_sound(word, self.voice_cache[word]).play()
                     print(f"🔊 Playing cached voice: {word}")
                     return True
                 except Exception as e:
                     print(f"❌ Error playing cached voice '{word}': {e}")
         
-        # Queue for generation if not available
+        # Queue for generation if not available and not already waiting
+        with self.voice_lock:
+            if word in self.voice_queued:
+                return False
+            self.voice_queued.add(word)
         print(f"🎤 Queueing voice generation: {word}")
         self.voice_queue.put(word)
         return False
@@ -257,9 +355,11 @@ class ResourceManager:
         # Only queue if not already available
         if not os.path.exists(voice_file):
             with self.voice_lock:
-                if word not in self.voice_cache:
-                    print(f"🎤 Preloading voice: {word}")
-                    self.voice_queue.put(word)
+                if word in self.voice_cache or word in self.voice_queued:
+                    return
+                self.voice_queued.add(word)
+            print(f"🎤 Preloading voice: {word}")
+            self.voice_queue.put(word)
     
     def preload_voices(self, words):
         """Preload multiple voices"""
@@ -4,15 +4,18 @@ import pygame
 
 THUMBNAIL_SIZE = (320, 240)
 
+# Fixed for the life of the process, so decided once at import
+SCREENSHOT_MODE = "--screenshot" in sys.argv or os.environ.get("SCREENSHOT_MODE") == "1"
+
 
 def screenshot_requested() -> bool:
     """Return True if a screenshot should be taken."""
-    return "--screenshot" in sys.argv or os.environ.get("SCREENSHOT_MODE") == "1"
+    return SCREENSHOT_MODE
 
 
 def check_screenshot(screen: pygame.Surface, output_path: str) -> None:
     """Save a scaled screenshot and exit if screenshot is requested."""
-    if not screenshot_requested():
+    if not SCREENSHOT_MODE:
         return
 
     thumbnail = pygame.transform.scale(screen, THUMBNAIL_SIZE)